@@ -2,6 +2,9 @@
 ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Requests are routed through config/asgi_urls.py, which serves the API's read
+endpoints from async views; run it with an ASGI server, e.g.
+``uvicorn config.asgi:application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
@@ -9,8 +12,19 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+from django.core.handlers.asgi import ASGIHandler, ASGIRequest
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_asgi_application()
+
+class AsyncAPIRequest(ASGIRequest):
+    urlconf = 'config.asgi_urls'
+
+
+class AsyncAPIHandler(ASGIHandler):
+    request_class = AsyncAPIRequest
+
+
+django.setup(set_prefix=False)
+application = AsyncAPIHandler()
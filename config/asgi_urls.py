@@ -0,0 +1,13 @@
+"""
+URL configuration used by the ASGI application (config/asgi.py).
+
+Serves the public API's list, detail, summary and health endpoints from
+async views, and everything else from the regular URLconf.
+"""
+from django.urls import path, include
+
+from .urls import urlpatterns as sync_urlpatterns
+
+urlpatterns = [
+    path('api/', include('portfolio.api_async_urls')),  # Async API reads
+] + sync_urlpatterns
@@ -1,3 +1,5 @@
+import importlib.util
+import tempfile
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -121,26 +123,104 @@ MEDIA_ROOT = BASE_DIR / 'media'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# The API response cache and its content versions must be shared by every
+# worker process, so the per-process local-memory cache is not enough here.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': Path(tempfile.gettempdir()) / 'devmitra-cache',
+    }
+}
+
+# Seconds a cached API response is kept (saves invalidate it immediately)
+API_CACHE_TIMEOUT = 60 * 60
+
+# Cache-Control for ViewSet responses (patch_cache_control keyword arguments).
+# CDNs may keep responses for a day; saves purge them through Surrogate-Key.
+API_CACHE_CONTROL = {
+    'public': True,
+    'max_age': 60,
+    's_maxage': 60 * 60 * 24,
+    'stale_while_revalidate': 60,
+    'stale_if_error': 60 * 60 * 24,
+}
+
+# Dotted path to a callable taking the list of surrogate keys to purge after a
+# save/delete (e.g. calling your CDN's purge API); None only logs them
+API_SURROGATE_PURGE = None
+
+# Most objects one ?ids= / ?slugs= batch lookup may ask for
+API_MAX_BATCH_SIZE = 50
+
+# Most results one /api/search/ request may return
+API_SEARCH_LIMIT = 50
+
+# SQLite file holding the rate limit counters, shared by all workers on a host
+API_THROTTLE_DB = Path(tempfile.gettempdir()) / 'devmitra-throttle.sqlite3'
+
+# Seconds each worker reuses its last deep health / readiness check result
+API_HEALTH_CACHE_SECONDS = 2
+
+# Seconds the /api/changes/ next_since token trails each pull. Rows are
+# stamped before their transaction commits; writes that stay uncommitted for
+# longer than this can be missed by delta-sync clients.
+API_SYNC_LAG_SECONDS = 60
+
+# Rows /api/export/ reads (and fetches related rows for) at a time
+API_EXPORT_CHUNK_SIZE = 500
+
+# Widths (px) uploaded screenshots, experience images, profile images and
+# icons are resized to, stored next to the original and listed in each
+# image's `*_renditions` srcset. Regenerate with generate_image_renditions.
+API_IMAGE_RENDITION_WIDTHS = (320, 640, 1280)
+
+# Threads the async (ASGI) API views run sync-only code in: authentication,
+# throttling, facet counts and non-fast serializers. Bounds the database
+# connections those calls hold at once.
+API_ASYNC_SYNC_THREADS = 8
+
+# API renderers, negotiated through the Accept header.
+# FastJSONRenderer uses orjson when installed; MessagePack needs msgpack.
+API_RENDERER_CLASSES = ['portfolio.api_renderers.FastJSONRenderer']
+if importlib.util.find_spec('msgpack') is not None:
+    API_RENDERER_CLASSES.append('portfolio.api_renderers.MessagePackRenderer')
+
+# Stateless JWT mode: build request.user from verified token claims instead
+# of loading the User row on every request. Verified tokens are kept in a
+# per-process LRU; revoked token ids are re-read at most every few seconds.
+API_JWT_STATELESS = False
+API_JWT_CACHE_SIZE = 1024
+API_JWT_REVOCATION_REFRESH = 5
+API_JWT_AUTHENTICATION_CLASS = (
+    'portfolio.api_auth.StatelessJWTAuthentication' if API_JWT_STATELESS
+    else 'rest_framework_simplejwt.authentication.JWTAuthentication'
+)
+
 # REST Framework Settings
 REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        API_JWT_AUTHENTICATION_CLASS,
+        'portfolio.api_keys.APIKeyAuthentication',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'portfolio.api_pagination.KeysetPagination',
     'PAGE_SIZE': 20,
-    'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
-    ],
+    'DEFAULT_RENDERER_CLASSES': API_RENDERER_CLASSES,
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle'
+        'portfolio.api_throttling.SharedAnonRateThrottle',
+        'portfolio.api_throttling.SharedUserRateThrottle',
+        'portfolio.api_throttling.APIKeyRateThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
         'anon': '100/hour',
-        'user': '1000/hour'
+        'user': '1000/hour',
+        # Default per-key budget; a key's own rate overrides it
+        'apikey': '5000/hour',
     }
 }
 
@@ -170,8 +250,17 @@ CORS_ALLOWED_ORIGINS = [
 
 CORS_ALLOW_CREDENTIALS = True
 
-# API Key for additional security (Generate a random key for production)
-API_KEY = 'your-secure-api-key-change-this-in-production'
+# API keys are issued per consumer (admin or `manage.py create_api_key`) and
+# sent as X-API-Key. Set API_KEY_REQUIRED to reject requests without one.
+API_KEY_REQUIRED = False
+# Seconds a process trusts a looked-up key (deactivation takes this long)
+API_KEY_CACHE_TTL = 60
+# Looked-up keys each process keeps: valid ones, and unknown/inactive ones
+API_KEY_CACHE_SIZE = 1024
+API_KEY_MISS_CACHE_SIZE = 256
+# Per-key usage counters are written after this many requests or seconds
+API_KEY_USAGE_FLUSH_COUNT = 100
+API_KEY_USAGE_FLUSH_INTERVAL = 30
 
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
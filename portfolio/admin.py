@@ -1,5 +1,6 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 from .models import (
+    APIKey,
     Project,
     Category,
     UserProfile,
@@ -9,6 +10,7 @@ from .models import (
     Skill,
     Achievement,
     Notification,
+    Technology,
 )
 
 # Register your models here.
@@ -33,6 +35,20 @@ class ProjectAdmin(admin.ModelAdmin):
     search_fields = ["title", "description", "project_name"]
     prepopulated_fields = {"slug": ("title",)}
     inlines = [ProjectScreenshotInline]
+    # Synced from the technologies field on save
+    exclude = ["technology_tags"]
+
+
+@admin.register(Technology)
+class TechnologyAdmin(admin.ModelAdmin):
+    list_display = ["name", "slug", "created_at"]
+    search_fields = ["name", "slug"]
+
+    def get_readonly_fields(self, request, obj=None):
+        # Tags mirror Project.technologies; rename there, not here
+        if obj is not None:
+            return ["name", "slug"]
+        return []
 
 
 @admin.register(ProjectScreenshot)
@@ -56,10 +72,14 @@ class CategoryAdmin(admin.ModelAdmin):
     prepopulated_fields = {"slug": ("name",)}
     list_filter = ["category_type", "created_at"]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_item_counts()
+
     def item_count(self, obj):
         return obj.item_count()
 
     item_count.short_description = "Items"
+    item_count.admin_order_field = "annotated_item_count"
 
 
 @admin.register(UserProfile)
@@ -248,3 +268,20 @@ class NotificationAdmin(admin.ModelAdmin):
         ('Status', {'fields': ('is_read', 'is_active')}),
         ('Timestamps', {'fields': ('created_at', 'updated_at')}),
     )
+
+
+@admin.register(APIKey)
+class APIKeyAdmin(admin.ModelAdmin):
+    list_display = ['name', 'prefix', 'scopes', 'rate', 'is_active', 'request_count', 'last_used_at']
+    list_filter = ['is_active']
+    search_fields = ['name', 'prefix']
+    readonly_fields = ['prefix', 'request_count', 'last_used_at', 'created_at', 'updated_at']
+
+    def save_model(self, request, obj, form, change):
+        raw_key = None if change else obj.set_key()
+        super().save_model(request, obj, form, change)
+        if raw_key:
+            messages.warning(
+                request,
+                f'API key for "{obj.name}": {raw_key} (copy it now; it is stored hashed and won\'t be shown again)',
+            )
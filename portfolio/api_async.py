@@ -0,0 +1,109 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+
+
+def get_async_sync_threads():
+    """Return how many threads run sync-only code for the async views"""
+    return getattr(settings, 'API_ASYNC_SYNC_THREADS', 8)
+
+
+sync_executor = ThreadPoolExecutor(
+    max_workers=get_async_sync_threads(), thread_name_prefix='api-sync'
+)
+
+
+def run_sync(func, *args, **kwargs):
+    """
+    Await `func(*args, **kwargs)` in the bounded sync pool.
+
+    For code with no async counterpart (authentication, throttling, facet
+    counts, serializers that read related objects). The pool caps how many
+    such calls, and so database connections, the async views use at once;
+    connections past CONN_MAX_AGE are closed after each call, as Django
+    does at the end of a sync request.
+    """
+    def call():
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+
+    return sync_to_async(call, thread_sensitive=False, executor=sync_executor)()
+
+
+def async_api_view(sync_view, handler):
+    """
+    Build an async Django view serving GETs of a DRF view.
+
+    `sync_view` is the view's as_view() function (or @api_view function),
+    whose class and init kwargs are reused, and `handler(view, request,
+    *args, **kwargs)` an async function returning the Response. Request
+    parsing, content negotiation, authentication, permissions, throttling,
+    exception handling and finalize_response() behave as in the sync view;
+    other methods (OPTIONS) are handed to the sync view.
+    """
+    view_class, initkwargs = sync_view.cls, sync_view.initkwargs
+    actions = getattr(sync_view, 'actions', None)
+
+    async def view(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return await run_sync(sync_view, request, *args, **kwargs)
+
+        self = view_class(**initkwargs)
+        if actions is not None:
+            self.action_map = actions
+            self.action = actions['get']
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await run_sync(self.initial, request, *args, **kwargs)
+            response = await handler(self, request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    view.csrf_exempt = True
+    view.cls = view_class
+    view.initkwargs = initkwargs
+    return view
+
+
+async def run_async_action(view, request, *args, **kwargs):
+    """Run the ViewSet's async twin of the routed action (alist, aretrieve)"""
+    return await getattr(view, f'a{view.action}')(request, *args, **kwargs)
+
+
+class AsyncReadMixin:
+    """
+    Async list and retrieve for read-only ViewSets.
+
+    The mixins above this one (conditional GET, response cache, facets,
+    the values() fast path) add async versions of their own behaviour and
+    call down to `alist` / `aretrieve`; what reaches this mixin runs the
+    plain sync action in the sync pool. Must come right before the DRF
+    ViewSet class.
+    """
+
+    async def alist(self, request, *args, **kwargs):
+        return await run_sync(super().list, request, *args, **kwargs)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        return await run_sync(super().retrieve, request, *args, **kwargs)
+
+    async def apaginate_queryset(self, queryset):
+        """paginate_queryset() for the async path"""
+        if self.paginator is None:
+            return None
+        paginate = getattr(self.paginator, 'apaginate_queryset', None)
+        if paginate is None:
+            return await run_sync(self.paginator.paginate_queryset, queryset, self.request, self)
+        return await paginate(queryset, self.request, view=self)
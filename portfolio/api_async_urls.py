@@ -0,0 +1,31 @@
+from django.urls import path, re_path
+
+from . import api_views
+from .api_async import async_api_view, run_async_action
+from .api_urls import router
+
+
+def get_async_pattern(pattern):
+    """Swap a router URL's list/retrieve view for its async version"""
+    if getattr(pattern.callback, 'actions', {}).get('get') not in ('list', 'retrieve'):
+        return pattern
+    return re_path(
+        pattern.pattern.regex.pattern,
+        async_api_view(pattern.callback, run_async_action),
+        name=pattern.name,
+    )
+
+
+# Router URLs in the router's order, so extra actions (featured, top) still
+# match before the detail route; they and the API root stay sync
+urlpatterns = [get_async_pattern(pattern) for pattern in router.urls]
+
+urlpatterns += [
+    path('summary/', async_api_view(api_views.portfolio_summary, api_views.aportfolio_summary), name='api-summary'),
+    path('health/', async_api_view(api_views.api_health_check, api_views.aapi_health_check), name='api-health'),
+    path(
+        'health/ready/',
+        async_api_view(api_views.api_readiness_check, api_views.aapi_readiness_check),
+        name='api-ready',
+    ),
+]
@@ -0,0 +1,138 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone as dt_timezone
+
+from django.apps import apps
+from django.conf import settings
+from django.utils import timezone
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import RevokedToken
+
+
+def get_token_cache_size():
+    """Return how many verified tokens each process remembers"""
+    return getattr(settings, 'API_JWT_CACHE_SIZE', 1024)
+
+
+def get_revocation_refresh():
+    """Return how many seconds a process trusts its copy of the revocation set"""
+    return getattr(settings, 'API_JWT_REVOCATION_REFRESH', 5)
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of raw token -> validated token, so a token's signature is
+    checked once rather than on every request. Entries are dropped when the
+    token expires.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.tokens = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, raw_token, now):
+        with self.lock:
+            token = self.tokens.get(raw_token)
+            if token is None:
+                return None
+            if token.get('exp', now + 1) <= now:
+                del self.tokens[raw_token]
+                return None
+            self.tokens.move_to_end(raw_token)
+            return token
+
+    def set(self, raw_token, token):
+        with self.lock:
+            self.tokens[raw_token] = token
+            self.tokens.move_to_end(raw_token)
+            while len(self.tokens) > self.size:
+                self.tokens.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.tokens.clear()
+
+
+class RevocationSet:
+    """
+    In-memory set of revoked token ids (jti), shared through the database.
+
+    `revoke()` stores a RevokedToken row per jti, so revocations are never
+    lost to a concurrent write or to cache eviction; expired rows are
+    deleted on every revoke. When the simplejwt token_blacklist app is
+    installed, the unexpired blacklisted jtis (e.g. refresh tokens
+    blacklisted after rotation) are merged in. Each process reloads its
+    copy at most every API_JWT_REVOCATION_REFRESH seconds.
+    """
+
+    def __init__(self):
+        self.jtis = frozenset()
+        self.loaded_at = None
+        self.lock = threading.Lock()
+
+    def load(self):
+        now = timezone.now()
+        revoked = set(RevokedToken.objects.filter(expires_at__gt=now).values_list('jti', flat=True))
+        if apps.is_installed('rest_framework_simplejwt.token_blacklist'):
+            from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+            revoked.update(
+                BlacklistedToken.objects
+                .filter(token__expires_at__gt=now)
+                .values_list('token__jti', flat=True)
+            )
+        return frozenset(revoked)
+
+    def __contains__(self, jti):
+        now = time.monotonic()
+        if self.loaded_at is None or now - self.loaded_at >= get_revocation_refresh():
+            with self.lock:
+                if self.loaded_at is None or now - self.loaded_at >= get_revocation_refresh():
+                    self.jtis = self.load()
+                    self.loaded_at = now
+        return jti in self.jtis
+
+    def revoke(self, jti, expires):
+        """Revoke a token id until `expires` (a Unix timestamp)"""
+        RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+        RevokedToken.objects.update_or_create(
+            jti=jti,
+            defaults={'expires_at': datetime.fromtimestamp(expires, tz=dt_timezone.utc)},
+        )
+        with self.lock:
+            self.jtis = self.jtis | {jti}
+
+
+verified_tokens = VerifiedTokenCache(get_token_cache_size())
+revoked_tokens = RevocationSet()
+
+
+def revoke_token(token):
+    """Reject a validated token in every process from now until it expires"""
+    revoked_tokens.revoke(token[api_settings.JTI_CLAIM], token['exp'])
+
+
+class StatelessJWTAuthentication(JWTStatelessUserAuthentication):
+    """
+    JWT authentication without a user query.
+
+    request.user is a simplejwt TokenUser built from the token's claims, so
+    authenticated requests don't touch the auth tables. Verified tokens are
+    kept in a bounded LRU and checked against the revocation set instead of
+    being decoded again.
+    """
+
+    def get_validated_token(self, raw_token):
+        token = verified_tokens.get(raw_token, time.time())
+        if token is None:
+            token = super().get_validated_token(raw_token)
+            verified_tokens.set(raw_token, token)
+
+        if token.get(api_settings.JTI_CLAIM) in revoked_tokens:
+            raise InvalidToken('Token has been revoked')
+        return token
@@ -0,0 +1,78 @@
+from django.conf import settings
+from django.db.models import Case, IntegerField, When
+from rest_framework.exceptions import ParseError
+from rest_framework.response import Response
+
+from .api_fieldsets import parse_field_list
+
+
+def get_max_batch_size():
+    """Return how many objects one batch lookup may ask for"""
+    return getattr(settings, 'API_MAX_BATCH_SIZE', 50)
+
+
+class BatchLookupMixin:
+    """
+    `?ids=` / `?slugs=` batch lookup for list endpoints.
+
+    Fetches exactly the requested objects in one IN query, using the same
+    queryset (filters, joins, prefetches, fieldsets) as the list, and
+    returns them unpaginated in the requested order. Unknown or
+    unpublished ids/slugs are left out.
+    """
+    # query param -> model field
+    batch_lookup_params = {'ids': 'pk', 'slugs': 'slug'}
+
+    def get_batch_lookup(self):
+        """Return (field, values) for the requested batch, or None"""
+        if self.action != 'list':
+            return None
+
+        requested = [
+            (param, field, parse_field_list(self.request.query_params.get(param)))
+            for param, field in self.batch_lookup_params.items()
+            if param in self.request.query_params
+        ]
+        if not requested:
+            return None
+        if len(requested) > 1:
+            raise ParseError('Use only one of: ' + ', '.join(self.batch_lookup_params))
+
+        param, field, values = requested[0]
+        values = list(dict.fromkeys(values))
+        if len(values) > get_max_batch_size():
+            raise ParseError(f'At most {get_max_batch_size()} {param} per request')
+        if field == 'pk':
+            try:
+                values = [int(value) for value in values]
+            except ValueError:
+                raise ParseError(f'Invalid {param}')
+        return field, values
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        batch = self.get_batch_lookup()
+        if batch is None:
+            return queryset
+
+        field, values = batch
+        position = Case(
+            *[When(**{field: value}, then=index) for index, value in enumerate(values)],
+            output_field=IntegerField(),
+        )
+        return queryset.filter(**{f'{field}__in': values}).order_by(position)
+
+    def paginate_queryset(self, queryset):
+        if self.get_batch_lookup() is not None:
+            return list(queryset)
+        return super().paginate_queryset(queryset)
+
+    async def apaginate_queryset(self, queryset):
+        if self.get_batch_lookup() is not None:
+            return [row async for row in queryset]
+        return await super().apaginate_queryset(queryset)
+
+    def get_paginated_response(self, data):
+        if self.get_batch_lookup() is not None:
+            return Response({'next': None, 'previous': None, 'results': data})
+        return super().get_paginated_response(data)
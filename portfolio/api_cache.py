@@ -0,0 +1,212 @@
+import hashlib
+import time
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.response import Response
+
+from .api_async import run_sync
+from .api_compression import apply_encoding, compress_variants, encoded_response, select_encoding
+
+
+VERSION_KEY_PREFIX = 'portfolio:version'
+CHANGED_KEY_PREFIX = 'portfolio:changed'
+RESPONSE_KEY_PREFIX = 'portfolio:response'
+
+# Headers stored with a cached body and sent again on every hit
+CACHED_HEADERS = ('Surrogate-Key',)
+
+
+def get_cache_timeout():
+    """Return how long cached API responses are kept"""
+    return getattr(settings, 'API_CACHE_TIMEOUT', 60 * 60)
+
+
+def _version_key(model):
+    return f'{VERSION_KEY_PREFIX}:{model._meta.label_lower}'
+
+
+def _changed_key(model):
+    return f'{CHANGED_KEY_PREFIX}:{model._meta.label_lower}'
+
+
+def get_content_version(*models):
+    """
+    Return the combined content version for the given models.
+
+    Versions start from a timestamp rather than 1, so a version key that was
+    evicted from the cache never comes back with a value that matches
+    responses cached before the eviction.
+    """
+    keys = [_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = cache.get(key)
+
+    return '.'.join(str(versions[key]) for key in keys)
+
+
+def get_content_changed_at(*models):
+    """
+    Return when any of the given models last changed, as a Unix time.
+
+    Recorded with each version bump. A model with no record yet counts as
+    changed now, so clients never get a Last-Modified older than the data.
+    """
+    keys = [_changed_key(model) for model in models]
+    changed = cache.get_many(keys)
+
+    for key in keys:
+        if key not in changed:
+            cache.add(key, time.time(), timeout=None)
+            changed[key] = cache.get(key)
+
+    return max(changed.values())
+
+
+def _incr_version(model):
+    try:
+        cache.incr(_version_key(model))
+    except ValueError:
+        cache.set(_version_key(model), time.time_ns(), timeout=None)
+    cache.set(_changed_key(model), time.time(), timeout=None)
+
+
+def bump_content_version(model):
+    """
+    Invalidate every cached response built from the given model.
+
+    Bumped at once, for reads inside the writing transaction, and again
+    when it commits: a concurrent read in between still sees the old rows
+    and would cache them under the first new version. Each bump also
+    records the change time (see get_content_changed_at()).
+    """
+    _incr_version(model)
+    transaction.on_commit(lambda: _incr_version(model), robust=True)
+
+
+def get_response_cache_key(view, request, prefix=RESPONSE_KEY_PREFIX):
+    """
+    Build the cache key for a read request.
+
+    The key covers the scheme and host, the view, the action, the URL kwargs
+    (slug/pk), the sorted query params, the negotiated media type and the
+    content version of every model the view depends on.
+    """
+    params = sorted(
+        (key, value)
+        for key, values in request.query_params.lists()
+        for value in values
+    )
+    lookup = sorted(view.kwargs.items())
+    # Bodies hold absolute URLs (pagination links, media), so the origin counts
+    raw = repr((
+        request.build_absolute_uri('/'), request.path, lookup, params, request.accepted_media_type,
+    ))
+    digest = hashlib.md5(raw.encode('utf-8')).hexdigest()
+    version = get_content_version(*view.cache_models)
+    return f'{prefix}:{view.basename}:{view.action}:{digest}:{version}'
+
+
+def lookup_cached(view, request, prefix=RESPONSE_KEY_PREFIX):
+    """Return (cache key, cached value or None) for a read request"""
+    key = get_response_cache_key(view, request, prefix)
+    return key, cache.get(key)
+
+
+def get_cached_response(request, cached):
+    """Build the response for a cache hit"""
+    content_type, variants, headers = cached
+    response = encoded_response(request, content_type, variants)
+    for header, value in headers.items():
+        response[header] = value
+    return response
+
+
+def store_on_render(response, request, key):
+    """Cache a successful response's body and variants once it is rendered"""
+    if not isinstance(response, Response) or response.status_code != 200:
+        return
+
+    def store(rendered):
+        variants = compress_variants(rendered.content)
+        headers = {header: rendered[header] for header in CACHED_HEADERS if header in rendered}
+        cache.set(key, (rendered['Content-Type'], variants, headers), get_cache_timeout())
+        encoding = select_encoding(request, variants)
+        rendered.content = variants[encoding]
+        apply_encoding(rendered, encoding)
+    response.add_post_render_callback(store)
+
+
+def cache_response(view_method):
+    """
+    Cache the rendered body of a successful ViewSet action.
+
+    The body is stored together with its gzip/brotli variants, compressed
+    once when it is cached, and each request is answered with the variant
+    its Accept-Encoding allows. Permissions, throttling and content
+    negotiation still run on every request; only the queryset,
+    serialization and compression work is skipped on a hit.
+
+    Works on async actions too (the ASGI read path). Django's cache
+    backends run their async methods in a thread one call at a time, so
+    the version and body lookups run together as one call in the sync pool
+    instead; the body is stored when Django renders the response, which it
+    also does in a thread.
+    """
+    if iscoroutinefunction(view_method):
+        @wraps(view_method)
+        async def async_wrapper(self, request, *args, **kwargs):
+            key, cached = await run_sync(lookup_cached, self, request)
+            if cached is not None:
+                return get_cached_response(request, cached)
+
+            response = await view_method(self, request, *args, **kwargs)
+            store_on_render(response, request, key)
+            return response
+
+        return async_wrapper
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key, cached = lookup_cached(self, request)
+        if cached is not None:
+            return get_cached_response(request, cached)
+
+        response = view_method(self, request, *args, **kwargs)
+        store_on_render(response, request, key)
+        return response
+
+    return wrapper
+
+
+class CachedResponseMixin:
+    """
+    Serve list and detail responses from the cache.
+
+    `cache_models` lists every model whose rows end up in the response, so
+    saving or deleting any of them invalidates the cached bodies.
+    """
+    cache_models = ()
+
+    @cache_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cache_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    @cache_response
+    async def alist(self, request, *args, **kwargs):
+        return await super().alist(request, *args, **kwargs)
+
+    @cache_response
+    async def aretrieve(self, request, *args, **kwargs):
+        return await super().aretrieve(request, *args, **kwargs)
@@ -0,0 +1,205 @@
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.module_loading import import_string
+from rest_framework import serializers
+from rest_framework.response import Response
+
+from .api_keys import get_api_key_required
+from .models import (
+    Project,
+    ProjectScreenshot,
+    Experience,
+    ExperienceImage,
+    Skill,
+    Achievement,
+    Category,
+    UserProfile,
+    Technology,
+)
+
+
+logger = logging.getLogger(__name__)
+
+SURROGATE_KEY_HEADER = 'Surrogate-Key'
+
+# model -> (surrogate key name, field the key is built from). Categories and
+# technologies are keyed by slug, the value their ?category= / ?technology=
+# filters take; everything else by id.
+SURROGATE_KEY_FIELDS = {
+    Project: ('project', 'id'),
+    Experience: ('experience', 'id'),
+    Skill: ('skill', 'id'),
+    Achievement: ('achievement', 'id'),
+    Category: ('category', 'slug'),
+    Technology: ('technology', 'slug'),
+    UserProfile: ('profile', 'id'),
+}
+
+
+def get_cache_control():
+    """Return the default Cache-Control directives for API responses"""
+    return getattr(settings, 'API_CACHE_CONTROL', {
+        'public': True,
+        'max_age': 60,
+        's_maxage': 60 * 60 * 24,
+        'stale_while_revalidate': 60,
+        'stale_if_error': 60 * 60 * 24,
+    })
+
+
+def is_shared_cacheable(request):
+    """
+    Whether a response may be stored by shared caches (CDNs).
+
+    Not when the request was authenticated (API key or JWT) or keys are
+    required: the CDN would hand the body to clients without one,
+    skipping key checks, scopes and per-key limits.
+    """
+    if get_api_key_required() or request.auth is not None:
+        return False
+    return not request.user.is_authenticated
+
+
+def surrogate_key(model, value):
+    name, _field = SURROGATE_KEY_FIELDS[model]
+    return f'{name}:{value}'
+
+
+def collect_surrogate_keys(serializer, rows, keys):
+    """
+    Add the keys of every object in serialized `rows` to `keys`.
+
+    Walks nested serializers too (a project's category). Returns False if
+    a row lacks its key field (e.g. a sparse fieldset without `id`), in
+    which case the response should also carry its collection key.
+    """
+    model = getattr(getattr(serializer, 'Meta', None), 'model', None)
+    key_field = SURROGATE_KEY_FIELDS.get(model, (None, None))[1]
+    nested = {
+        name: field.child if isinstance(field, serializers.ListSerializer) else field
+        for name, field in serializer.fields.items()
+        if isinstance(field, serializers.BaseSerializer)
+    }
+
+    complete = True
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        if key_field is not None:
+            if row.get(key_field) in (None, ''):
+                complete = False
+            else:
+                keys.add(surrogate_key(model, row[key_field]))
+        for name, child in nested.items():
+            value = row.get(name)
+            if value:
+                complete &= collect_surrogate_keys(child, value if isinstance(value, list) else [value], keys)
+    return complete
+
+
+def get_instance_keys(instance):
+    """
+    Return the surrogate keys a saved/deleted object can appear under.
+
+    Includes the objects whose output embeds or counts it: a project's
+    category (item_count) and technologies (project_count), and the
+    project/experience a screenshot or image belongs to.
+    """
+    model = type(instance)
+    if model is ProjectScreenshot:
+        return {surrogate_key(Project, instance.project_id)}
+    if model is ExperienceImage:
+        return {surrogate_key(Experience, instance.experience_id)}
+    if model not in SURROGATE_KEY_FIELDS:
+        return set()
+
+    keys = {surrogate_key(model, getattr(instance, SURROGATE_KEY_FIELDS[model][1]))}
+    if model is Project and instance.pk is not None:
+        if instance.category_id is not None:
+            keys.update(
+                surrogate_key(Category, slug)
+                for slug in Category.objects.filter(pk=instance.category_id).values_list('slug', flat=True)
+            )
+        keys.update(
+            surrogate_key(Technology, slug)
+            for slug in instance.technology_tags.values_list('slug', flat=True)
+        )
+    return keys
+
+
+def get_collection_keys(model):
+    """Return the collection keys of every list endpoint built from `model`"""
+    from .api_urls import router
+
+    return {
+        viewset.surrogate_collection
+        for _prefix, viewset, _basename in router.registry
+        if model in getattr(viewset, 'cache_models', ()) and getattr(viewset, 'surrogate_collection', None)
+    }
+
+
+def purge_surrogate_keys(keys):
+    """
+    Pass changed surrogate keys to the API_SURROGATE_PURGE handler.
+
+    The handler is a dotted path to a callable taking a sorted list of keys
+    (e.g. one calling the CDN's purge-by-key API); without one, the keys
+    are only logged.
+    """
+    keys = sorted(keys)
+    if not keys:
+        return
+    handler = getattr(settings, 'API_SURROGATE_PURGE', None)
+    logger.debug('Purging surrogate keys: %s', ' '.join(keys))
+    if handler:
+        import_string(handler)(keys)
+
+
+def schedule_purge(keys):
+    """Purge `keys` once the current transaction commits"""
+    keys = set(keys)
+    transaction.on_commit(lambda: purge_surrogate_keys(keys), robust=True)
+
+
+class EdgeCacheMixin:
+    """
+    CDN caching headers for read-only ViewSets.
+
+    Successful GET responses (and 304s) get Cache-Control from
+    API_CACHE_CONTROL, updated by the view's `cache_control`. 200s also
+    name the objects they contain in a Surrogate-Key header, plus the
+    view's `surrogate_collection` for responses that aren't a single
+    object, so a purge of `project:12` or `projects` drops exactly the
+    responses that could have changed. Responses to authenticated
+    requests (or when API_KEY_REQUIRED) are `private, no-store` instead,
+    see is_shared_cacheable(). Must come before
+    CachedResponseMixin so the key header is cached with the body.
+    """
+    cache_control = {}
+    surrogate_collection = None
+
+    def get_surrogate_keys(self, data):
+        keys = set()
+        rows = data.get('results', [data]) if isinstance(data, dict) else data
+        complete = collect_surrogate_keys(self.get_serializer(), rows, keys)
+        is_detail = self.action == 'retrieve' or (isinstance(data, dict) and 'results' not in data)
+        if self.surrogate_collection and (not is_detail or not complete):
+            keys.add(self.surrogate_collection)
+        return keys
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if request.method not in ('GET', 'HEAD') or response.status_code not in (200, 304):
+            return response
+
+        if is_shared_cacheable(request):
+            patch_cache_control(response, **{**get_cache_control(), **self.cache_control})
+        else:
+            response['Cache-Control'] = 'private, no-store'
+        patch_vary_headers(response, ['Accept'])
+        if response.status_code == 200 and isinstance(response, Response) and response.data is not None:
+            response[SURROGATE_KEY_HEADER] = ' '.join(sorted(self.get_surrogate_keys(response.data)))
+        return response
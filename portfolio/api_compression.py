@@ -0,0 +1,112 @@
+import gzip
+
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional encoding
+    brotli = None
+
+
+# Bodies shorter than this are not worth compressing (same as GZipMiddleware)
+MIN_COMPRESS_LENGTH = 200
+
+# Preferred content codings, best first
+ENCODINGS = ('br', 'gzip')
+
+
+def compress_variants(content):
+    """
+    Return {encoding: body} for a response body.
+
+    Always contains 'identity'; 'gzip' and 'br' (when brotli is installed)
+    are added if they actually shrink the body. This runs once when a body
+    is cached, so the slowest/smallest settings are used.
+    """
+    variants = {'identity': content}
+    if len(content) < MIN_COMPRESS_LENGTH:
+        return variants
+
+    compressed = gzip.compress(content, compresslevel=9, mtime=0)
+    if len(compressed) < len(content):
+        variants['gzip'] = compressed
+
+    if brotli is not None:
+        compressed = brotli.compress(content, quality=11)
+        if len(compressed) < len(content):
+            variants['br'] = compressed
+
+    return variants
+
+
+def get_accepted_encodings(request):
+    """Parse Accept-Encoding into {coding: qvalue}"""
+    accepted = {}
+    for item in request.META.get('HTTP_ACCEPT_ENCODING', '').split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        name, _, value = params.strip().partition('=')
+        if name.strip().lower() == 'q':
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def select_encoding(request, variants):
+    """Pick the best stored variant the client accepts"""
+    accepted = get_accepted_encodings(request)
+    for encoding in ENCODINGS:
+        if encoding in variants and accepted.get(encoding, accepted.get('*', 0)) > 0:
+            return encoding
+    return 'identity'
+
+
+def apply_encoding(response, encoding):
+    """Set Content-Encoding/Vary (and adjust the ETag) for a chosen variant"""
+    if encoding != 'identity':
+        response['Content-Encoding'] = encoding
+        if response.has_header('ETag'):
+            response['ETag'] = encoded_etag(response['ETag'], encoding)
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return response
+
+
+def encoded_response(request, content_type, variants):
+    """Build a response from stored variants for the request's Accept-Encoding"""
+    encoding = select_encoding(request, variants)
+    response = HttpResponse(variants[encoding], content_type=content_type)
+    return apply_encoding(response, encoding)
+
+
+def encoded_etag(etag, encoding):
+    """
+    Give each content coding its own strong ETag ("abc" -> "abc-br").
+
+    A strong validator must differ between representations, and the
+    gzip and br bodies are different bytes.
+    """
+    if not encoding or encoding == 'identity':
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def match_encoded_etag(request, etag):
+    """
+    Return the If-None-Match tag that names `etag` in any content coding.
+
+    Lets a client that cached the gzip variant ("abc-gzip") get a 304 for
+    "abc". Returns `etag` itself when nothing matches.
+    """
+    variants = {etag} | {encoded_etag(etag, encoding) for encoding in ENCODINGS}
+    for tag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+        if tag in variants:
+            return tag
+    return etag
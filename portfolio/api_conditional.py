@@ -0,0 +1,121 @@
+import hashlib
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from .api_async import run_sync
+from .api_cache import get_content_changed_at, get_content_version, get_response_cache_key
+from .api_compression import encoded_etag, match_encoded_etag
+
+
+VALIDATORS_KEY_PREFIX = 'portfolio:validators'
+
+
+def get_validators(view, request):
+    """
+    Return the (etag, last_modified) pair for a read request.
+
+    The ETag hashes the request's cache key, which already carries the
+    path, query params, media type and the content version of every model
+    in the response, so any save or delete that could change the body (a
+    new screenshot, a renamed category) changes it too. Last-Modified is
+    when any of those models last changed. Neither needs a query, so a
+    304 costs no database work and each cursor page is validated as
+    cheaply as the first.
+    """
+    key = get_response_cache_key(view, request, prefix=VALIDATORS_KEY_PREFIX)
+    etag = '"%s"' % hashlib.md5(key.encode('utf-8')).hexdigest()
+    return etag, int(get_content_changed_at(*view.cache_models))
+
+
+def respond_conditionally(request, etag, last_modified, get_response):
+    """
+    Return a 304 if the client's validators match, else `get_response()`.
+
+    Successful responses carry a strong ETag (one per content coding) and,
+    when known, a Last-Modified header.
+    """
+    client_etag = match_encoded_etag(request, etag)
+    response = get_conditional_response(request, etag=client_etag, last_modified=last_modified)
+    if response is None:
+        response = get_response()
+    return set_validators(response, etag, client_etag, last_modified)
+
+
+async def arespond_conditionally(request, etag, last_modified, get_response):
+    """respond_conditionally() for an async `get_response`"""
+    client_etag = match_encoded_etag(request, etag)
+    response = get_conditional_response(request, etag=client_etag, last_modified=last_modified)
+    if response is None:
+        response = await get_response()
+    return set_validators(response, etag, client_etag, last_modified)
+
+
+def set_validators(response, etag, client_etag, last_modified):
+    """Add the ETag and Last-Modified headers to a 200 or 304"""
+    if response.status_code == 304:
+        response['ETag'] = client_etag
+    elif response.status_code == 200:
+        response['ETag'] = encoded_etag(etag, response.get('Content-Encoding'))
+    if response.status_code in (200, 304) and last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+def conditional_response(view_method):
+    """Answer If-None-Match / If-Modified-Since with a 304 before the action runs"""
+    if iscoroutinefunction(view_method):
+        @wraps(view_method)
+        async def async_wrapper(self, request, *args, **kwargs):
+            etag, last_modified = await run_sync(get_validators, self, request)
+            return await arespond_conditionally(
+                request, etag, last_modified,
+                lambda: view_method(self, request, *args, **kwargs),
+            )
+
+        return async_wrapper
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        etag, last_modified = get_validators(self, request)
+        return respond_conditionally(
+            request, etag, last_modified,
+            lambda: view_method(self, request, *args, **kwargs),
+        )
+
+    return wrapper
+
+
+def get_summary_etag(request, *args, **kwargs):
+    """ETag for views built from whole-table statistics of the given models"""
+    from .models import Project, Experience, Skill, Achievement, UserProfile
+
+    version = get_content_version(Project, Experience, Skill, Achievement, UserProfile)
+    return hashlib.md5(f'{request.path}:{version}'.encode('utf-8')).hexdigest()
+
+
+class ConditionalResponseMixin:
+    """
+    Conditional GET support for read-only ViewSets.
+
+    Expects `cache_models` from CachedResponseMixin, which this mixin must
+    come before so a 304 never touches the response cache.
+    """
+
+    @conditional_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @conditional_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    @conditional_response
+    async def alist(self, request, *args, **kwargs):
+        return await super().alist(request, *args, **kwargs)
+
+    @conditional_response
+    async def aretrieve(self, request, *args, **kwargs):
+        return await super().aretrieve(request, *args, **kwargs)
@@ -0,0 +1,211 @@
+import hashlib
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Prefetch, Q
+from django.utils import timezone
+
+from .api_async import run_sync
+from .api_cache import get_cache_timeout, get_content_version
+from .api_compression import compress_variants
+from .api_renderers import dumps_json
+from .models import (
+    Project,
+    ProjectScreenshot,
+    Experience,
+    ExperienceImage,
+    Skill,
+    Achievement,
+    Category,
+    UserProfile,
+)
+from .serializers import (
+    ProjectSerializer,
+    ExperienceSerializer,
+    SkillSerializer,
+    AchievementSerializer,
+    UserProfileSerializer,
+    PortfolioSummarySerializer,
+)
+
+
+DOCUMENT_KEY_PREFIX = 'portfolio:document'
+
+# Every model whose rows end up in the portfolio bundle
+BUNDLE_MODELS = (
+    Project,
+    ProjectScreenshot,
+    Experience,
+    ExperienceImage,
+    Skill,
+    Achievement,
+    Category,
+    UserProfile,
+)
+
+
+# summary key suffix -> (model, published filter)
+SUMMARY_COUNTS = {
+    'projects': (Project, Q(is_active=True) & ~Q(status='draft')),
+    'experience': (Experience, Q(is_active=True, is_draft=False)),
+    'skills': (Skill, Q(is_active=True, is_draft=False)),
+    'achievements': (Achievement, Q(is_active=True, is_draft=False)),
+}
+
+# Every model the summary statistics are computed from
+SUMMARY_MODELS = (Project, Experience, Skill, Achievement, UserProfile)
+
+
+def build_portfolio_summary():
+    """
+    Compute the portfolio statistics.
+
+    One conditional-aggregation query per model returns both the total and
+    the published count, plus one query for the profile.
+    """
+    summary = {}
+    for name, (model, published) in SUMMARY_COUNTS.items():
+        counts = model.objects.aggregate(
+            total=Count('pk'), active=Count('pk', filter=published)
+        )
+        summary[f'total_{name}'] = counts['total']
+        summary[f'active_{name}'] = counts['active']
+
+    years = UserProfile.objects.order_by('pk').values_list('experience_years', flat=True).first()
+    summary['years_of_experience'] = years or 0
+    return summary
+
+
+async def abuild_portfolio_summary():
+    """build_portfolio_summary() with the async ORM"""
+    summary = {}
+    for name, (model, published) in SUMMARY_COUNTS.items():
+        counts = await model.objects.aaggregate(
+            total=Count('pk'), active=Count('pk', filter=published)
+        )
+        summary[f'total_{name}'] = counts['total']
+        summary[f'active_{name}'] = counts['active']
+
+    years = await UserProfile.objects.order_by('pk').values_list('experience_years', flat=True).afirst()
+    summary['years_of_experience'] = years or 0
+    return summary
+
+
+def lookup_portfolio_summary():
+    """Return (cache key, cached statistics or None) for the current content version"""
+    key = f'{DOCUMENT_KEY_PREFIX}:summary:{get_content_version(*SUMMARY_MODELS)}'
+    return key, cache.get(key)
+
+
+def get_portfolio_summary():
+    """
+    Return the portfolio statistics served by /api/summary/.
+
+    Stored under the content version of the counted models, so the
+    statistics are recomputed once per change and reads never touch the
+    content tables.
+    """
+    key, summary = lookup_portfolio_summary()
+    if summary is None:
+        summary = build_portfolio_summary()
+        cache.set(key, summary, get_cache_timeout())
+    return summary
+
+
+async def aget_portfolio_summary():
+    """get_portfolio_summary() computing the statistics with the async ORM"""
+    key, summary = await run_sync(lookup_portfolio_summary)
+    if summary is None:
+        summary = await abuild_portfolio_summary()
+        await run_sync(cache.set, key, summary, get_cache_timeout())
+    return summary
+
+
+def build_portfolio_document():
+    """
+    Serialize all published content into one document.
+
+    Uses the same serializers and filters as the API endpoints. There is no
+    request here, so media URLs are relative (/media/...).
+    """
+    profile = UserProfile.objects.first()
+    projects = (
+        Project.objects.filter(is_active=True)
+        .exclude(status='draft')
+        .prefetch_related(
+            Prefetch('category', queryset=Category.objects.with_item_counts()), 'screenshots'
+        )
+        .order_by('-order', '-created_at')
+    )
+    experience = (
+        Experience.objects.filter(is_active=True, is_draft=False)
+        .prefetch_related('images')
+        .order_by('-start_date')
+    )
+    skills = Skill.objects.filter(is_active=True, is_draft=False).order_by('-proficiency', 'name')
+    achievements = Achievement.objects.filter(is_active=True, is_draft=False).order_by(
+        '-achievement_date', '-created_at'
+    )
+
+    return {
+        'profile': UserProfileSerializer(profile).data if profile else None,
+        'projects': ProjectSerializer(projects, many=True).data,
+        'experience': ExperienceSerializer(experience, many=True).data,
+        'skills': SkillSerializer(skills, many=True).data,
+        'achievements': AchievementSerializer(achievements, many=True).data,
+        'summary': PortfolioSummarySerializer(get_portfolio_summary()).data,
+        'generated_at': timezone.now(),
+    }
+
+
+def get_portfolio_version():
+    """Return the content version the bundle document is stored under"""
+    return get_content_version(*BUNDLE_MODELS)
+
+
+def get_portfolio_etag():
+    """Strong ETag for the bundle endpoint, derived from the content version"""
+    return '"%s"' % hashlib.md5(get_portfolio_version().encode('utf-8')).hexdigest()
+
+
+def get_portfolio_document():
+    """
+    Return the bundle as {encoding: JSON bytes}.
+
+    The document and its gzip/brotli variants are stored under the current
+    content version, so they are built and compressed at most once per
+    change and reads are a single cache get.
+    """
+    key = f'{DOCUMENT_KEY_PREFIX}:bundle:{get_portfolio_version()}'
+    variants = cache.get(key)
+    if variants is None:
+        variants = compress_variants(dumps_json(build_portfolio_document()))
+        cache.set(key, variants, get_cache_timeout())
+    return variants
+
+
+def warm_portfolio_document():
+    """Rebuild the bundle right after a content change is committed"""
+    get_portfolio_document()
+
+
+def schedule_portfolio_warm():
+    """
+    Warm the bundle once the current transaction commits.
+
+    Registered at most once per transaction, however many rows it saves:
+    the pending callback is kept on the connection and reused while it is
+    still queued (a rollback drops it from the queue, so the next change
+    registers a new one).
+    """
+    connection = transaction.get_connection()
+    pending = getattr(connection, 'pending_portfolio_warm', None)
+    if pending is not None and any(entry[1] is pending for entry in connection.run_on_commit):
+        return
+
+    def warm():
+        connection.pending_portfolio_warm = None
+        warm_portfolio_document()
+
+    connection.pending_portfolio_warm = warm
+    transaction.on_commit(warm, robust=True)
@@ -0,0 +1,124 @@
+import hashlib
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import Http404, StreamingHttpResponse
+
+from .api_cache import get_content_version
+from .api_conditional import respond_conditionally
+from .api_renderers import dumps_json
+
+
+# export format -> content type
+EXPORT_FORMATS = {
+    'jsonl': 'application/x-ndjson',
+    'json': 'application/json',
+}
+
+
+def get_export_chunk_size():
+    """Return how many rows an export reads (and prefetches for) at a time"""
+    return getattr(settings, 'API_EXPORT_CHUNK_SIZE', 500)
+
+
+def get_export_view(viewset, request):
+    """Return a viewset instance set up for the list action of `request`"""
+    view = viewset()
+    view.action_map = {'get': 'list'}
+    view.action = 'list'
+    view.request = request
+    view.format_kwarg = None
+    view.args, view.kwargs = (), {}
+    return view
+
+
+def iter_chunks(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def export_rows(view, chunk_size):
+    """
+    Return an iterator over the serialized rows of a list view.
+
+    The queryset is built (and request params validated) up front, so bad
+    params still get an error response. Rows are then read with
+    iterator(chunk_size=...), so only one chunk is held in memory: the
+    values() fast path fetches nested relations per chunk, otherwise the
+    queryset's prefetch_related lookups run per chunk.
+    """
+    queryset = view.filter_queryset(view.get_queryset())
+    fast = view.get_fast_serializer(queryset) if hasattr(view, 'get_fast_serializer') else None
+
+    def rows():
+        if fast is not None:
+            values = fast.values(queryset).iterator(chunk_size=chunk_size)
+            for chunk in iter_chunks(values, chunk_size):
+                yield from fast.serialize(chunk)
+        else:
+            instances = queryset.iterator(chunk_size=chunk_size)
+            for chunk in iter_chunks(instances, chunk_size):
+                yield from view.get_serializer(chunk, many=True).data
+
+    return rows()
+
+
+def iter_export_body(rows, export_format):
+    """Encode rows as JSON Lines or as one JSON array, a row at a time"""
+    if export_format == 'jsonl':
+        for row in rows:
+            yield dumps_json(row) + b'\n'
+        return
+
+    separator = b'['
+    for row in rows:
+        yield separator + dumps_json(row)
+        separator = b','
+    yield b']' if separator == b',' else b'[]'
+
+
+async def aiter_export_body(body, chunk_size):
+    """
+    Serve a sync export body to an ASGI server, `chunk_size` rows at a time.
+
+    Django would otherwise read a sync iterator to the end before sending
+    anything. The rows are read on the request's thread-sensitive thread,
+    the one the view (and so the database cursor) ran on.
+    """
+    next_pieces = sync_to_async(lambda: list(islice(body, chunk_size)), thread_sensitive=True)
+    while pieces := await next_pieces():
+        yield b''.join(pieces)
+
+
+def get_export_etag(viewset, request):
+    """
+    ETag for an export, derived from the full URL (rows hold absolute
+    media URLs) and the exported models
+    """
+    version = get_content_version(*viewset.cache_models)
+    return '"%s"' % hashlib.md5(f'{request.build_absolute_uri()}:{version}'.encode('utf-8')).hexdigest()
+
+
+def export_response(viewset, request, collection, export_format):
+    """
+    Stream every row of a list endpoint, without pagination.
+
+    The endpoint's filters, batch lookups and sparse fieldsets apply as on
+    the list itself. Clients that already have the current export get a 304.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise Http404('Unknown export format')
+
+    def stream():
+        chunk_size = get_export_chunk_size()
+        body = iter_export_body(export_rows(get_export_view(viewset, request), chunk_size), export_format)
+        if isinstance(request._request, ASGIRequest):
+            body = aiter_export_body(body, chunk_size)
+        response = StreamingHttpResponse(body, content_type=EXPORT_FORMATS[export_format])
+        response['Content-Disposition'] = f'inline; filename="{collection}.{export_format}"'
+        return response
+
+    return respond_conditionally(request, get_export_etag(viewset, request), None, stream)
@@ -0,0 +1,78 @@
+from django.db.models import Count
+from rest_framework.exceptions import ParseError
+
+from .api_async import run_sync
+from .api_fieldsets import parse_field_list
+
+
+class FacetMixin:
+    """
+    `?facets=` support for list endpoints.
+
+    Adds a `facets` object to the list response with, for each requested
+    facet, the number of matching rows per value. Counts cover every row
+    that matches the request's filters (not just the current page) and are
+    computed with one GROUP BY query per facet.
+
+    `facet_fields` maps facet names to (value field, label field or None);
+    a `count_<name>_facet(queryset)` method overrides the default query.
+    Views without `facet_fields` ignore the parameter.
+    """
+    facet_fields = {}
+
+    def get_requested_facets(self):
+        names = parse_field_list(self.request.query_params.get('facets'))
+        if not names or not self.facet_fields:
+            return []
+        unknown = [name for name in names if name not in self.facet_fields]
+        if unknown:
+            raise ParseError('Unknown facet: ' + ', '.join(unknown))
+        return list(dict.fromkeys(names))
+
+    def count_facet(self, queryset, name):
+        """Return [{value, label, count}] for one facet, most common first"""
+        method = getattr(self, f'count_{name}_facet', None)
+        if method is not None:
+            return method(queryset)
+
+        value_field, label_field = self.facet_fields[name]
+        labels = {}
+        if label_field is None:
+            model_field = queryset.model._meta.get_field(value_field)
+            labels = dict(model_field.flatchoices)
+
+        fields = [value_field] + ([label_field] if label_field else [])
+        rows = (
+            queryset.order_by()
+            .exclude(**{f'{value_field}__isnull': True})
+            .values(*fields)
+            .annotate(count=Count('pk'))
+            .order_by('-count', value_field)
+        )
+        return [
+            {
+                'value': row[value_field],
+                'label': row[label_field] if label_field else labels.get(row[value_field], row[value_field]),
+                'count': row['count'],
+            }
+            for row in rows
+        ]
+
+    def count_facets(self, names):
+        queryset = self.filter_queryset(self.get_queryset())
+        return {name: self.count_facet(queryset, name) for name in names}
+
+    def list(self, request, *args, **kwargs):
+        names = self.get_requested_facets()
+        response = super().list(request, *args, **kwargs)
+        if names and isinstance(response.data, dict):
+            response.data['facets'] = self.count_facets(names)
+        return response
+
+    async def alist(self, request, *args, **kwargs):
+        # Facet counts (and count_<name>_facet overrides) are sync queries
+        names = self.get_requested_facets()
+        response = await super().alist(request, *args, **kwargs)
+        if names and isinstance(response.data, dict):
+            response.data['facets'] = await run_sync(self.count_facets, names)
+        return response
@@ -0,0 +1,269 @@
+from collections import defaultdict
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Prefetch
+from django.http import Http404
+from rest_framework import serializers
+from rest_framework.response import Response
+
+
+# Fields whose to_representation() returns database values unchanged
+PASSTHROUGH_FIELDS = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.ChoiceField,
+)
+
+
+class FastPathUnsupported(Exception):
+    """The serializer has a field the values() path can't reproduce"""
+
+
+class FastSerializer:
+    """
+    values()-based equivalent of a ModelSerializer, for lists.
+
+    Built from a serializer instance: plain fields are read from one
+    values() query, nested relations (forward foreign keys and reverse
+    many) are fetched with one values() query per relation and stitched
+    in, and the output has the same keys, order and values as
+    `serializer.data`. Computed fields need an entry in the serializer's
+    `Meta.fast_fields` ({name: (columns, function(row))}); any other field
+    it can't map raises FastPathUnsupported.
+
+    `querysets` maps relation names to the querysets (e.g. from a view's
+    Prefetch objects) related rows are read from.
+    """
+
+    def __init__(self, serializer, querysets=None):
+        self.model = serializer.Meta.model
+        self.request = serializer.context.get('request')
+        self.querysets = querysets or {}
+        meta = self.model._meta
+        fast_fields = getattr(serializer.Meta, 'fast_fields', {})
+
+        self.columns = {meta.pk.attname}
+        self.fields = []
+        self.relations = {}
+
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if name in fast_fields:
+                columns, function = fast_fields[name]
+                self.columns.update(columns)
+                self.fields.append((name, 'function', function))
+                continue
+
+            source = field.source
+            if source.startswith('get_') and source.endswith('_display'):
+                model_field = self._get_model_field(source[len('get_'):-len('_display')])
+                self.columns.add(model_field.attname)
+                self.fields.append((name, 'display', (model_field.attname, dict(model_field.flatchoices))))
+                continue
+
+            model_field = self._get_model_field(source)
+            if isinstance(field, serializers.ListSerializer) and model_field.one_to_many:
+                self.relations[name] = (model_field, FastSerializer(field.child))
+                self.fields.append((name, 'many', None))
+            elif isinstance(field, serializers.BaseSerializer) and model_field.many_to_one:
+                self.columns.add(model_field.attname)
+                self.relations[name] = (model_field, FastSerializer(field))
+                self.fields.append((name, 'one', model_field.attname))
+            elif model_field.is_relation or not model_field.concrete:
+                raise FastPathUnsupported(f'{self.model.__name__}.{name}')
+            elif isinstance(field, serializers.FileField):
+                self.columns.add(model_field.attname)
+                self.fields.append((name, 'file', (model_field.attname, model_field.storage)))
+            elif isinstance(field, PASSTHROUGH_FIELDS):
+                self.columns.add(model_field.attname)
+                self.fields.append((name, 'value', model_field.attname))
+            else:
+                self.columns.add(model_field.attname)
+                self.fields.append((name, 'convert', (model_field.attname, field.to_representation)))
+
+    def _get_model_field(self, name):
+        try:
+            return self.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            raise FastPathUnsupported(f'{self.model.__name__}.{name}')
+
+    def values(self, queryset, *extra):
+        """Return the values() queryset the rows are read from"""
+        columns = dict.fromkeys([*self.columns, *extra])
+        return queryset.select_related(None).prefetch_related(None).values(*columns)
+
+    def _get_related_queryset(self, name, model_field):
+        queryset = self.querysets.get(name)
+        if queryset is None:
+            queryset = model_field.related_model._default_manager.all()
+        return queryset
+
+    def _get_relation_rows(self, name, rows):
+        """Return the values() query for one relation's rows, or None if there are none"""
+        model_field, child = self.relations[name]
+        queryset = self._get_related_queryset(name, model_field)
+        if model_field.one_to_many:
+            parent_ids = [row[self.model._meta.pk.attname] for row in rows]
+            return child.values(
+                queryset.filter(**{f'{model_field.field.name}__in': parent_ids}),
+                model_field.field.attname,
+            )
+        ids = {row[model_field.attname] for row in rows} - {None}
+        return child.values(queryset.filter(pk__in=ids)) if ids else None
+
+    def _index_relation(self, name, child_rows, data):
+        """Map serialized related rows to the key the parent rows refer to them by"""
+        model_field, _child = self.relations[name]
+        if model_field.one_to_many:
+            fk_name = model_field.field.attname
+            grouped = defaultdict(list)
+            for child_row, item in zip(child_rows, data):
+                grouped[child_row[fk_name]].append(item)
+            return grouped
+        child_pk = model_field.related_model._meta.pk.attname
+        return {child_row[child_pk]: item for child_row, item in zip(child_rows, data)}
+
+    def _fetch_relations(self, rows):
+        """Return {relation name: {key: serialized value}}"""
+        related = {}
+        for name, (_model_field, child) in self.relations.items():
+            queryset = self._get_relation_rows(name, rows)
+            child_rows = list(queryset) if queryset is not None else []
+            related[name] = self._index_relation(name, child_rows, child.serialize(child_rows))
+        return related
+
+    async def _afetch_relations(self, rows):
+        """_fetch_relations() with the async ORM"""
+        related = {}
+        for name, (_model_field, child) in self.relations.items():
+            queryset = self._get_relation_rows(name, rows)
+            child_rows = [row async for row in queryset] if queryset is not None else []
+            related[name] = self._index_relation(name, child_rows, await child.aserialize(child_rows))
+        return related
+
+    def serialize(self, rows):
+        """Turn values() rows into the serializer's output dicts"""
+        rows = list(rows)
+        if not rows:
+            return []
+        return self._build(rows, self._fetch_relations(rows) if self.relations else {})
+
+    async def aserialize(self, rows):
+        """serialize() for rows already read, fetching relations with the async ORM"""
+        rows = list(rows)
+        if not rows:
+            return []
+        return self._build(rows, await self._afetch_relations(rows) if self.relations else {})
+
+    def _build(self, rows, related):
+        pk_name = self.model._meta.pk.attname
+        request = self.request
+        results = []
+
+        for row in rows:
+            data = {}
+            for name, kind, extra in self.fields:
+                if kind == 'value':
+                    data[name] = row[extra]
+                elif kind == 'function':
+                    data[name] = extra(row)
+                elif kind == 'convert':
+                    value = row[extra[0]]
+                    data[name] = None if value is None else extra[1](value)
+                elif kind == 'display':
+                    value = extra[1].get(row[extra[0]], row[extra[0]])
+                    data[name] = None if value is None else str(value)
+                elif kind == 'file':
+                    file_name = row[extra[0]]
+                    if not file_name:
+                        data[name] = None
+                    else:
+                        url = extra[1].url(file_name)
+                        data[name] = request.build_absolute_uri(url) if request is not None else url
+                elif kind == 'many':
+                    data[name] = related[name].get(row[pk_name], [])
+                else:
+                    value = row[extra]
+                    data[name] = None if value is None else related[name].get(value)
+            results.append(data)
+        return results
+
+
+class FastListMixin:
+    """
+    values()-based list action for read-only ViewSets.
+
+    Used when the view sets `fast_list = True` and the request has no
+    sparse fieldset params; falls back to the serializer if the serializer
+    has a field FastSerializer can't reproduce. Nested relations are read
+    through the view's Prefetch querysets, so annotations there (e.g.
+    category item counts) are kept.
+
+    On the async path (AsyncReadMixin) list and detail both read their
+    rows with the async ORM.
+    """
+    fast_list = False
+
+    def get_fast_serializer(self, queryset):
+        if not self.fast_list:
+            return None
+        if 'fields' in self.request.query_params or 'expand' in self.request.query_params:
+            return None
+
+        querysets = {
+            lookup.prefetch_to: lookup.queryset
+            for lookup in queryset._prefetch_related_lookups
+            if isinstance(lookup, Prefetch) and lookup.queryset is not None
+        }
+        try:
+            return FastSerializer(self.get_serializer(), querysets)
+        except FastPathUnsupported:
+            return None
+
+    def get_fast_rows(self, fast, queryset):
+        ordering = [name.lstrip('-') for name in getattr(self, 'ordering', ())]
+        return fast.values(queryset, *ordering)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        fast = self.get_fast_serializer(queryset)
+        if fast is None:
+            return super().list(request, *args, **kwargs)
+
+        rows = self.get_fast_rows(fast, queryset)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(fast.serialize(page))
+        return Response(fast.serialize(rows))
+
+    async def alist(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        fast = self.get_fast_serializer(queryset)
+        if fast is None:
+            return await super().alist(request, *args, **kwargs)
+
+        rows = self.get_fast_rows(fast, queryset)
+        page = await self.apaginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(await fast.aserialize(page))
+        return Response(await fast.aserialize([row async for row in rows]))
+
+    async def aretrieve(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        fast = self.get_fast_serializer(queryset)
+        if fast is None:
+            return await super().aretrieve(request, *args, **kwargs)
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            row = await fast.values(
+                queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+            ).afirst()
+        except (TypeError, ValueError, ValidationError):
+            row = None
+        if row is None:
+            raise Http404(f'No {queryset.model._meta.object_name} matches the given query.')
+        self.check_object_permissions(request, row)
+        return Response((await fast.aserialize([row]))[0])
@@ -0,0 +1,112 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+
+def parse_field_list(value):
+    """Split a comma-separated query param into a list of names"""
+    if value is None:
+        return None
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    Serializer mixin for `?fields=` and `?expand=`.
+
+    Pass `fields` to keep only those fields, and `expand` to choose which of
+    `Meta.expandable_fields` are rendered as nested objects. When either is
+    given, relations that are not expanded collapse to their primary keys.
+    Without both, the serializer output is unchanged.
+    """
+
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is None and expand is None:
+            return
+
+        expand = set(expand or ())
+        for name, many in getattr(self.Meta, 'expandable_fields', {}).items():
+            if name in self.fields and name not in expand:
+                self.fields[name] = serializers.PrimaryKeyRelatedField(read_only=True, many=many)
+
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class SparseFieldsetMixin:
+    """
+    ViewSet mixin that trims the queryset to the requested fieldset.
+
+    Only the columns behind the selected fields are loaded, expanded
+    relations are joined or prefetched in full, and collapsed to-many
+    relations prefetch their primary keys only.
+    """
+
+    def get_sparse_fieldset(self):
+        """Return the (fields, expand) lists requested in the query string"""
+        params = self.request.query_params
+        return parse_field_list(params.get('fields')), parse_field_list(params.get('expand'))
+
+    def get_serializer(self, *args, **kwargs):
+        fields, expand = self.get_sparse_fieldset()
+        kwargs.setdefault('fields', fields)
+        kwargs.setdefault('expand', expand)
+        return super().get_serializer(*args, **kwargs)
+
+    def sparse_queryset(self, queryset):
+        """Restrict the SELECT and prefetches to the requested fieldset"""
+        fields, expand = self.get_sparse_fieldset()
+        if fields is None and expand is None:
+            return queryset
+
+        serializer = self.get_serializer()
+        meta = queryset.model._meta
+        source_columns = getattr(serializer.Meta, 'source_columns', {})
+        columns = {meta.pk.name}
+        columns.update(name.lstrip('-') for name in getattr(self, 'ordering', ()))
+        select_related = []
+        prefetch_related = []
+        # Keep the view's own Prefetch for relations that stay expanded
+        prefetches = {
+            getattr(lookup, 'prefetch_to', lookup): lookup
+            for lookup in queryset._prefetch_related_lookups
+        }
+
+        for name, field in serializer.fields.items():
+            if name in source_columns:
+                columns.update(source_columns[name])
+                continue
+
+            source = field.source
+            if source.startswith('get_') and source.endswith('_display'):
+                source = source[len('get_'):-len('_display')]
+            try:
+                model_field = meta.get_field(source)
+            except FieldDoesNotExist:
+                continue
+
+            if model_field.one_to_many:
+                if isinstance(field, serializers.ManyRelatedField):
+                    related = model_field.related_model.objects.only(
+                        model_field.related_model._meta.pk.name,
+                        model_field.field.name,
+                    )
+                    prefetch_related.append(Prefetch(source, queryset=related))
+                else:
+                    prefetch_related.append(prefetches.get(source, source))
+            elif model_field.concrete:
+                columns.add(source)
+                if model_field.is_relation and isinstance(field, serializers.BaseSerializer):
+                    if source in prefetches:
+                        prefetch_related.append(prefetches[source])
+                    else:
+                        select_related.append(source)
+
+        queryset = queryset.select_related(None).prefetch_related(None)
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset.only(*columns)
@@ -0,0 +1,97 @@
+import logging
+import os
+import stat
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+
+logger = logging.getLogger(__name__)
+
+HEALTH_CACHE_KEY = 'portfolio:health:%d'
+
+
+def get_health_cache_seconds():
+    """Return how long one process reuses its last probe result"""
+    return getattr(settings, 'API_HEALTH_CACHE_SECONDS', 2)
+
+
+def check_database():
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1 FROM django_migrations LIMIT 1')
+        cursor.fetchone()
+
+
+def check_cache():
+    key = HEALTH_CACHE_KEY % os.getpid()
+    token = str(time.time())
+    cache.set(key, token, 30)
+    if cache.get(key) != token:
+        raise RuntimeError('cache did not return the value just written')
+
+
+def check_media():
+    try:
+        mode = os.stat(settings.MEDIA_ROOT).st_mode
+    except FileNotFoundError:
+        # Created by the first upload; a fresh deploy has none yet
+        return
+    if not stat.S_ISDIR(mode):
+        raise NotADirectoryError(str(settings.MEDIA_ROOT))
+
+
+HEALTH_CHECKS = {
+    'database': check_database,
+    'cache': check_cache,
+    'media': check_media,
+}
+
+
+def run_health_checks():
+    """
+    Run every check and return {'healthy': bool, 'checks': {name: result}}.
+
+    The endpoints are public, so a failure is reported only as an error
+    status; the exception (which may name paths or hosts) is logged.
+    """
+    checks = {}
+    for name, check in HEALTH_CHECKS.items():
+        start = time.perf_counter()
+        try:
+            check()
+        except Exception:
+            logger.exception('Health check %s failed', name)
+            result = {'status': 'error'}
+        else:
+            result = {'status': 'ok'}
+        result['latency_ms'] = round((time.perf_counter() - start) * 1000, 2)
+        checks[name] = result
+    return {
+        'healthy': all(result['status'] == 'ok' for result in checks.values()),
+        'checks': checks,
+    }
+
+
+_last_result = None
+_last_run = None
+_lock = threading.Lock()
+
+
+def get_health():
+    """
+    Return run_health_checks(), reused for API_HEALTH_CACHE_SECONDS.
+
+    The result is kept per process (each worker reports on itself) and only
+    one thread runs the checks at a time; the others wait for and share its
+    result, so a burst of probes can't pile queries onto a struggling worker.
+    """
+    global _last_result, _last_run
+    with _lock:
+        now = time.monotonic()
+        if _last_run is None or now - _last_run >= get_health_cache_seconds():
+            _last_result = run_health_checks()
+            _last_run = time.monotonic()
+        return _last_result
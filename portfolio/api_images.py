@@ -0,0 +1,146 @@
+import io
+import logging
+import os
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+from rest_framework import serializers
+
+from .models import (
+    ProjectScreenshot,
+    ExperienceImage,
+    Skill,
+    Achievement,
+    UserProfile,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# model -> image fields that get renditions, each stored in `<field>_renditions`
+RENDITION_FIELDS = {
+    ProjectScreenshot: ['image'],
+    ExperienceImage: ['image'],
+    Skill: ['icon_image'],
+    Achievement: ['icon_image'],
+    UserProfile: ['profile_image'],
+}
+
+# Pillow format -> save() options for the renditions
+SAVE_OPTIONS = {
+    'JPEG': {'quality': 85, 'optimize': True, 'progressive': True},
+    'PNG': {'optimize': True},
+    'WEBP': {'quality': 85},
+}
+
+
+def get_rendition_widths():
+    """Return the widths (in pixels) images are resized to"""
+    return sorted(getattr(settings, 'API_IMAGE_RENDITION_WIDTHS', (320, 640, 1280)))
+
+
+def get_rendition_name(name, width):
+    """Return the storage name of a rendition, next to the original"""
+    root, ext = os.path.splitext(name)
+    return f'{root}_{width}w{ext}'
+
+
+def build_renditions(field_file):
+    """
+    Resize an uploaded image to every narrower rendition width.
+
+    Returns what `<field>_renditions` stores: the original's name and
+    size, and the name and size of each rendition. Renditions keep the
+    original's format; widths at or above the original's are skipped.
+    """
+    with field_file.open('rb'):
+        image = Image.open(field_file)
+        image_format = image.format
+        image = ImageOps.exif_transpose(image)
+
+    width, height = image.size
+    if image_format == 'JPEG' and image.mode not in ('RGB', 'L'):
+        image = image.convert('RGB')
+
+    renditions = []
+    for rendition_width in get_rendition_widths():
+        if rendition_width >= width:
+            break
+        rendition_height = max(1, round(height * rendition_width / width))
+        output = io.BytesIO()
+        image.resize((rendition_width, rendition_height), Image.LANCZOS).save(
+            output, format=image_format, **SAVE_OPTIONS.get(image_format, {})
+        )
+        name = field_file.storage.save(
+            get_rendition_name(field_file.name, rendition_width), ContentFile(output.getvalue())
+        )
+        renditions.append({'name': name, 'width': rendition_width, 'height': rendition_height})
+
+    return {'source': field_file.name, 'width': width, 'height': height, 'renditions': renditions}
+
+
+def update_renditions(instance, force=False):
+    """
+    Generate the renditions of an object's new or replaced images.
+
+    Called before the object is saved: a new upload is written to storage
+    first (as the save would), so each image is resized once, when it
+    changes. Images that can't be read get no renditions.
+    """
+    for name in RENDITION_FIELDS[type(instance)]:
+        field_file = getattr(instance, name)
+        stored = getattr(instance, f'{name}_renditions') or {}
+        if not field_file:
+            setattr(instance, f'{name}_renditions', {})
+            continue
+        if not force and stored.get('source') == field_file.name:
+            continue
+
+        if not field_file._committed:
+            field_file.save(field_file.name, field_file.file, save=False)
+        elif stored.get('source') == field_file.name:
+            # Regenerating: free the names so the new copies can take them
+            for rendition in stored['renditions']:
+                field_file.storage.delete(rendition['name'])
+        try:
+            renditions = build_renditions(field_file)
+        except (OSError, Image.DecompressionBombError) as exc:
+            logger.warning('Could not build renditions of %s: %s', field_file.name, exc)
+            renditions = {}
+        setattr(instance, f'{name}_renditions', renditions)
+
+
+class ImageRenditionsField(serializers.Field):
+    """
+    Read-only responsive variants of an image.
+
+    Renders a `<field>_renditions` column as the original's `width` and
+    `height`, its `renditions` ({url, width, height}, narrowest first) and
+    a `srcset` listing them and the original; null when there is no image.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def get_url(self, name):
+        url = default_storage.url(name)
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request is not None else url
+
+    def to_representation(self, value):
+        if not value:
+            return None
+        renditions = [
+            {'url': self.get_url(rendition['name']), 'width': rendition['width'], 'height': rendition['height']}
+            for rendition in value['renditions']
+        ]
+        candidates = [*renditions, {'url': self.get_url(value['source']), 'width': value['width']}]
+        return {
+            'width': value['width'],
+            'height': value['height'],
+            'srcset': ', '.join(f"{candidate['url']} {candidate['width']}w" for candidate in candidates),
+            'renditions': renditions,
+        }
@@ -0,0 +1,201 @@
+import atexit
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.db.models import F
+from django.utils import timezone
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+
+from .models import APIKey
+
+
+API_KEY_HEADER = 'X-API-Key'
+
+
+def get_api_key_required():
+    """Return whether API requests must carry a key"""
+    return getattr(settings, 'API_KEY_REQUIRED', False)
+
+
+def get_api_key_cache_ttl():
+    """Return how many seconds a process trusts a looked-up key"""
+    return getattr(settings, 'API_KEY_CACHE_TTL', 60)
+
+
+def get_api_key_cache_size():
+    return getattr(settings, 'API_KEY_CACHE_SIZE', 1024)
+
+
+def get_api_key_miss_cache_size():
+    return getattr(settings, 'API_KEY_MISS_CACHE_SIZE', 256)
+
+
+def get_usage_flush_count():
+    return getattr(settings, 'API_KEY_USAGE_FLUSH_COUNT', 100)
+
+
+def get_usage_flush_interval():
+    return getattr(settings, 'API_KEY_USAGE_FLUSH_INTERVAL', 30)
+
+
+class APIKeyInfo:
+    """What a request needs to know about its API key (set as request.auth)"""
+
+    __slots__ = ('id', 'name', 'scopes', 'rate')
+
+    def __init__(self, id, name, scopes, rate):
+        self.id = id
+        self.name = name
+        self.scopes = frozenset(scopes)
+        self.rate = rate or None
+
+    def has_scope(self, scope):
+        return '*' in self.scopes or scope in self.scopes
+
+
+class APIKeyCache:
+    """
+    Bounded LRU of raw key -> lookup result, each kept for
+    API_KEY_CACHE_TTL seconds.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, raw_key, now):
+        """Return (found, value) for an unexpired entry"""
+        with self.lock:
+            entry = self.entries.get(raw_key)
+            if entry is None:
+                return False, None
+            if entry[0] <= now:
+                del self.entries[raw_key]
+                return False, None
+            self.entries.move_to_end(raw_key)
+            return True, entry[1]
+
+    def set(self, raw_key, value, now):
+        with self.lock:
+            self.entries[raw_key] = (now + get_api_key_cache_ttl(), value)
+            self.entries.move_to_end(raw_key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+# Valid keys and misses are kept apart, so a client sending made-up keys
+# only ever evicts other misses
+key_cache = APIKeyCache(get_api_key_cache_size())
+miss_cache = APIKeyCache(get_api_key_miss_cache_size())
+
+
+def lookup_api_key(raw_key):
+    """
+    Return the APIKeyInfo for a raw key, or None if it isn't valid.
+
+    Results are kept in-process for API_KEY_CACHE_TTL seconds, keyed by the
+    raw key, so a repeat lookup does no hashing and no query: valid keys in
+    an LRU of API_KEY_CACHE_SIZE, unknown/inactive ones in a smaller one of
+    API_KEY_MISS_CACHE_SIZE. Deactivating or deleting a key takes effect in
+    other processes once their entry expires.
+    """
+    now = time.monotonic()
+    for lookups in (key_cache, miss_cache):
+        found, info = lookups.get(raw_key, now)
+        if found:
+            return info
+
+    row = (
+        APIKey.objects
+        .filter(key_hash=APIKey.hash_key(raw_key), is_active=True)
+        .values('pk', 'name', 'scopes', 'rate')
+        .first()
+    )
+    if row is None:
+        miss_cache.set(raw_key, None, now)
+        return None
+
+    scopes = [scope.strip() for scope in row['scopes'].split(',') if scope.strip()]
+    info = APIKeyInfo(row['pk'], row['name'], scopes, row['rate'])
+    key_cache.set(raw_key, info, now)
+    return info
+
+
+def clear_api_key_cache():
+    key_cache.clear()
+    miss_cache.clear()
+
+
+class UsageCounter:
+    """
+    Per-key request counts, written to the database in batches.
+
+    Counts are flushed (one UPDATE per key) every API_KEY_USAGE_FLUSH_COUNT
+    requests or API_KEY_USAGE_FLUSH_INTERVAL seconds, whichever comes
+    first, and when the process exits.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+        self.pending = 0
+        self.flushed_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def add(self, key_id):
+        with self.lock:
+            self.counts[key_id] += 1
+            self.pending += 1
+            due = (
+                self.pending >= get_usage_flush_count()
+                or time.monotonic() - self.flushed_at >= get_usage_flush_interval()
+            )
+        if due:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            counts, self.counts = self.counts, Counter()
+            self.pending = 0
+            self.flushed_at = time.monotonic()
+
+        now = timezone.now()
+        for key_id, count in counts.items():
+            APIKey.objects.filter(pk=key_id).update(
+                request_count=F('request_count') + count,
+                last_used_at=now,
+            )
+
+
+api_key_usage = UsageCounter()
+atexit.register(api_key_usage.flush)
+
+
+class APIKeyAuthentication(BaseAuthentication):
+    """
+    Authenticate requests carrying an `X-API-Key` header.
+
+    request.user stays anonymous; request.auth is the key's APIKeyInfo,
+    which APIKeyPermission checks scopes against and APIKeyRateThrottle
+    budgets. An unknown or inactive key is rejected.
+    """
+
+    def authenticate(self, request):
+        raw_key = request.headers.get(API_KEY_HEADER)
+        if not raw_key:
+            return None
+
+        info = lookup_api_key(raw_key)
+        if info is None:
+            raise AuthenticationFailed('Invalid API key')
+
+        api_key_usage.add(info.id)
+        return AnonymousUser(), info
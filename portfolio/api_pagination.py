@@ -0,0 +1,156 @@
+import base64
+import binascii
+import json
+from functools import reduce
+from operator import or_
+
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination over a ViewSet's `ordering`.
+
+    The cursor carries the ordering values of the boundary row, and the next
+    page is fetched with a `WHERE (a, b, id) < (...)` style filter instead of
+    an OFFSET, so every page costs the same and no COUNT(*) is ever run.
+    The primary key is appended to the ordering to make it unique. Ordering
+    columns must not be nullable.
+    """
+    cursor_query_param = 'cursor'
+    page_size = api_settings.PAGE_SIZE
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.get_page(list(self.get_page_queryset(queryset, request, view)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset() reading the page with the async ORM"""
+        return self.get_page([row async for row in self.get_page_queryset(queryset, request, view)])
+
+    def get_page_queryset(self, queryset, request, view):
+        """Return the query for the requested page, plus one row to detect more"""
+        self.request = request
+        self.model = queryset.model
+        self.ordering = self.get_ordering(view)
+        self.cursor_values, self.reverse = self.decode_cursor(request)
+
+        ordering = self.ordering
+        if self.reverse:
+            ordering = [(name, not descending) for name, descending in ordering]
+        if self.cursor_values is not None:
+            queryset = queryset.filter(self.get_seek_filter(ordering, self.cursor_values))
+
+        queryset = queryset.order_by(
+            *[f'-{name}' if descending else name for name, descending in ordering]
+        )
+        return queryset[:self.page_size + 1]
+
+    def get_page(self, rows):
+        """Trim the fetched rows to the page and record the cursor state"""
+        values, reverse = self.cursor_values, self.reverse
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        if reverse:
+            self.has_next, self.has_previous = values is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, values is not None
+        self.first_values = self.get_row_values(rows[0]) if rows else values
+        self.last_values = self.get_row_values(rows[-1]) if rows else values
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_ordering(self, view):
+        """Return the view's ordering as (field name, descending) pairs"""
+        ordering = getattr(view, 'ordering', None)
+        if not ordering:
+            raise ImproperlyConfigured(
+                f'{view.__class__.__name__} needs an `ordering` to use KeysetPagination.'
+            )
+
+        pairs = [(name.lstrip('-'), name.startswith('-')) for name in ordering]
+        pk_name = self.model._meta.pk.name
+        if pk_name not in {name for name, _ in pairs}:
+            pairs.append((pk_name, pairs[-1][1]))
+        return pairs
+
+    def get_seek_filter(self, ordering, values):
+        """Match rows strictly after `values` in the given ordering"""
+        clauses = []
+        for index, (name, descending) in enumerate(ordering):
+            lookup = {prev_name: values[prev_index] for prev_index, (prev_name, _) in enumerate(ordering[:index])}
+            lookup[f'{name}__lt' if descending else f'{name}__gt'] = values[index]
+            clauses.append(Q(**lookup))
+        return reduce(or_, clauses)
+
+    def get_row_values(self, row):
+        if isinstance(row, dict):
+            return [row[name] for name, _ in self.ordering]
+        return [getattr(row, name) for name, _ in self.ordering]
+
+    def encode_cursor(self, values, reverse):
+        payload = {
+            'v': [value.isoformat() if hasattr(value, 'isoformat') else value for value in values],
+        }
+        if reverse:
+            payload['r'] = 1
+        raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        cursor = base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request):
+        """Return (ordering values, reverse) from the request, or (None, False)"""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            raw = base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4))
+            payload = json.loads(raw)
+            strings = payload['v']
+            if len(strings) != len(self.ordering):
+                raise ValueError
+            values = [
+                self.model._meta.get_field(name).to_python(value)
+                for (name, _), value in zip(self.ordering, strings)
+            ]
+        except (binascii.Error, ValueError, TypeError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        return values, bool(payload.get('r'))
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.last_values, reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self.encode_cursor(self.first_values, reverse=True)
+
@@ -0,0 +1,82 @@
+from django.db.models import Case, IntegerField, Q, When
+
+from .models import Project, Skill, RankedList
+
+
+# list name -> (model, rows that may appear, ranking, length)
+RANKED_LISTS = {
+    'featured-projects': (
+        Project,
+        Q(is_active=True, is_featured=True) & ~Q(status='draft'),
+        ('-order', '-created_at'),
+        6,
+    ),
+    'top-skills': (
+        Skill,
+        Q(is_active=True, is_draft=False),
+        ('-proficiency', 'name'),
+        10,
+    ),
+}
+
+# model -> names of the ranked lists built from it
+RANKED_LIST_NAMES = {
+    model: [name for name, (other, *_rest) in RANKED_LISTS.items() if other is model]
+    for model, *_rest in RANKED_LISTS.values()
+}
+
+
+def rank_queryset(queryset, name):
+    """
+    Rank the rows of `queryset` itself, as a ranked list would.
+
+    For a filtered queryset (e.g. one category's featured projects): the
+    stored list only holds the top rows overall, which may include few or
+    none of the filtered ones.
+    """
+    _model, published, ranking, length = RANKED_LISTS[name]
+    return queryset.filter(published).order_by(*ranking)[:length]
+
+
+def rebuild_ranked_list(name):
+    """Recompute a ranked list, store its ids and return them"""
+    model = RANKED_LISTS[name][0]
+    ids = list(rank_queryset(model.objects.all(), name).values_list('pk', flat=True))
+    RankedList.objects.update_or_create(name=name, defaults={'object_ids': ids})
+    return ids
+
+
+def rebuild_ranked_lists(model=None):
+    """Rebuild every ranked list (or those built from `model`); return how many"""
+    names = RANKED_LIST_NAMES.get(model, []) if model is not None else list(RANKED_LISTS)
+    for name in names:
+        rebuild_ranked_list(name)
+    return len(names)
+
+
+def get_ranked_ids(name):
+    """
+    Return the stored ids of a ranked list, best first.
+
+    One lookup by name; a list that was never stored (e.g. a fresh
+    database) is built on first use.
+    """
+    ids = RankedList.objects.filter(name=name).values_list('object_ids', flat=True).first()
+    if ids is None:
+        ids = rebuild_ranked_list(name)
+    return ids
+
+
+def filter_ranked(queryset, name):
+    """
+    Return the rows of a ranked list from `queryset`, in rank order.
+
+    Rows are fetched by primary key; `queryset` still applies its own
+    filters, so a row unpublished since the list was built is left out.
+    """
+    ids = get_ranked_ids(name)
+    position = Case(
+        *[When(pk=pk, then=index) for index, pk in enumerate(ids)],
+        output_field=IntegerField(),
+    )
+    return queryset.filter(pk__in=ids).order_by(position)
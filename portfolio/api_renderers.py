@@ -0,0 +1,100 @@
+import datetime
+import decimal
+import json
+import uuid
+
+from django.utils.functional import Promise
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional format
+    msgpack = None
+
+
+def encode_default(obj):
+    """
+    Convert the types orjson/msgpack don't handle into JSON-compatible ones.
+
+    Matches DRF's JSONEncoder: Decimal becomes a string (as with
+    COERCE_DECIMAL_TO_STRING), dates become ISO 8601 strings.
+    """
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if isinstance(obj, datetime.datetime):
+        representation = obj.isoformat()
+        if representation.endswith('+00:00'):
+            representation = representation[:-6] + 'Z'
+        return representation
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, Promise):
+        return str(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if hasattr(obj, '__iter__'):
+        return list(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not serializable')
+
+
+def dumps_json(data):
+    """
+    Encode data as compact UTF-8 JSON bytes, using orjson when installed.
+
+    The bytes match DRF's JSONRenderer: orjson hands datetimes to
+    encode_default() (for the `Z` suffix), and U+2028/U+2029 are escaped
+    so the output is also valid JavaScript.
+    """
+    if orjson is not None:
+        body = orjson.dumps(
+            data,
+            default=encode_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    else:
+        body = json.dumps(
+            data, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':')
+        ).encode('utf-8')
+    return body.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    Produces the same document as DRF's JSONRenderer (compact, UTF-8) and
+    falls back to it when orjson is not installed or an indented response
+    is requested via `Accept: application/json; indent=N`.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps_json(data)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Binary MessagePack renderer, selected with `Accept: application/msgpack`.
+
+    Requires the msgpack package.
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=encode_default, use_bin_type=True)
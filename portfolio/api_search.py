@@ -0,0 +1,219 @@
+import hashlib
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q
+from django.utils.html import escape
+from rest_framework import status
+from rest_framework.exceptions import APIException, ParseError
+
+from .api_cache import get_content_version
+from .models import Project, Experience, Skill, Achievement
+
+
+SEARCH_TABLE = 'portfolio_search'
+
+# collection name -> (model, published filter, title field, body fields)
+SEARCH_COLLECTIONS = {
+    'projects': (
+        Project,
+        Q(is_active=True) & ~Q(status='draft'),
+        'title',
+        ('description', 'technologies', 'documentation'),
+    ),
+    'skills': (Skill, Q(is_active=True, is_draft=False), 'name', ('description',)),
+    'experience': (
+        Experience,
+        Q(is_active=True, is_draft=False),
+        'position',
+        ('company_name', 'short_description'),
+    ),
+    'achievements': (
+        Achievement,
+        Q(is_active=True, is_draft=False),
+        'title',
+        ('issuing_organization', 'short_description'),
+    ),
+}
+
+SEARCH_COLLECTION_NAMES = {model: name for name, (model, *_rest) in SEARCH_COLLECTIONS.items()}
+
+# collection name -> number folded into its rows' FTS rowids (never reuse one)
+SEARCH_COLLECTION_KEYS = {'projects': 1, 'skills': 2, 'experience': 3, 'achievements': 4}
+ROWID_SLOTS = 8
+
+# BM25 column weights: collection, object_id, slug, title, body
+RANK_WEIGHTS = (0.0, 0.0, 0.0, 10.0, 1.0)
+
+# Snippet markers, swapped for <mark> after the text is HTML-escaped
+MATCH_START = '\x02'
+MATCH_END = '\x03'
+
+SEARCH_TOKEN = re.compile(r'\w+', re.UNICODE)
+
+
+class SearchUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Search requires the SQLite FTS5 backend.'
+    default_code = 'search_unavailable'
+
+
+def get_search_limit():
+    """Return the most results one search may return"""
+    return getattr(settings, 'API_SEARCH_LIMIT', 50)
+
+
+def search_enabled():
+    return connection.vendor == 'sqlite'
+
+
+def get_search_rowid(collection, object_id):
+    """
+    Return the FTS rowid of an object's search row.
+
+    collection and object_id are UNINDEXED columns, so filtering on them
+    scans the whole index; updates and deletes go by this rowid instead.
+    """
+    return object_id * ROWID_SLOTS + SEARCH_COLLECTION_KEYS[collection]
+
+
+def _document(instance, title_field, body_fields):
+    title = getattr(instance, title_field) or ''
+    body = '\n'.join(getattr(instance, field) or '' for field in body_fields)
+    return title, body
+
+
+def index_instance(instance):
+    """Add, update or drop one object's search row after a save"""
+    collection = SEARCH_COLLECTION_NAMES.get(type(instance))
+    if collection is None or not search_enabled():
+        return
+
+    model, published, title_field, body_fields = SEARCH_COLLECTIONS[collection]
+    remove_instance(instance)
+    if not model.objects.filter(published, pk=instance.pk).exists():
+        return
+
+    title, body = _document(instance, title_field, body_fields)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {SEARCH_TABLE} (rowid, collection, object_id, slug, title, body) '
+            'VALUES (%s, %s, %s, %s, %s, %s)',
+            [
+                get_search_rowid(collection, instance.pk),
+                collection, instance.pk, getattr(instance, 'slug', '') or '', title, body,
+            ],
+        )
+
+
+def remove_instance(instance):
+    """Drop one object's search row"""
+    collection = SEARCH_COLLECTION_NAMES.get(type(instance))
+    if collection is None or not search_enabled():
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s',
+            [get_search_rowid(collection, instance.pk)],
+        )
+
+
+def rebuild_search_index():
+    """Re-index every published object; returns the number of rows"""
+    if not search_enabled():
+        raise SearchUnavailable()
+
+    rows = []
+    for collection, (model, published, title_field, body_fields) in SEARCH_COLLECTIONS.items():
+        for instance in model.objects.filter(published).only('pk', 'slug', title_field, *body_fields):
+            title, body = _document(instance, title_field, body_fields)
+            rows.append((
+                get_search_rowid(collection, instance.pk),
+                collection, instance.pk, instance.slug or '', title, body,
+            ))
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+        cursor.executemany(
+            f'INSERT INTO {SEARCH_TABLE} (rowid, collection, object_id, slug, title, body) '
+            'VALUES (%s, %s, %s, %s, %s, %s)',
+            rows,
+        )
+    return len(rows)
+
+
+def build_match_query(text):
+    """
+    Turn free text into an FTS5 query.
+
+    Every word must match, the last one as a prefix (search-as-you-type).
+    Words are quoted, so FTS5 operators and punctuation in the input are
+    treated as plain text.
+    """
+    tokens = SEARCH_TOKEN.findall(text)
+    if not tokens:
+        return None
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def _mark(text):
+    """HTML-escape FTS output and turn the match markers into <mark> tags"""
+    return escape(text).replace(MATCH_START, '<mark>').replace(MATCH_END, '</mark>')
+
+
+def search(text, collections=None, limit=20):
+    """
+    Return the best BM25 matches for `text` as a list of dicts.
+
+    Matches in the title weigh more than matches in the body. `title` and
+    `snippet` are HTML-escaped with matches wrapped in <mark>.
+    """
+    if not search_enabled():
+        raise SearchUnavailable()
+
+    match = build_match_query(text)
+    if match is None:
+        return []
+
+    unknown = set(collections or ()) - set(SEARCH_COLLECTIONS)
+    if unknown:
+        raise ParseError('Unknown type: ' + ', '.join(sorted(unknown)))
+
+    sql = (
+        f'SELECT collection, object_id, slug, '
+        f"highlight({SEARCH_TABLE}, 3, %s, %s), "
+        f"snippet({SEARCH_TABLE}, 4, %s, %s, '…', 16), "
+        f'bm25({SEARCH_TABLE}, {", ".join(map(str, RANK_WEIGHTS))}) AS rank '
+        f'FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s'
+    )
+    params = [MATCH_START, MATCH_END, MATCH_START, MATCH_END, match]
+    if collections:
+        sql += f' AND collection IN ({", ".join(["%s"] * len(collections))})'
+        params.extend(collections)
+    sql += ' ORDER BY rank LIMIT %s'
+    params.append(limit)
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    return [
+        {
+            'type': collection,
+            'id': object_id,
+            'slug': slug,
+            'title': _mark(title),
+            'snippet': _mark(snippet),
+            'score': round(-rank, 4),
+        }
+        for collection, object_id, slug, title, snippet, rank in rows
+    ]
+
+
+def get_search_etag(request, *args, **kwargs):
+    """ETag for a search, derived from the query and the searched models"""
+    version = get_content_version(*SEARCH_COLLECTION_NAMES)
+    return hashlib.md5(f'{request.get_full_path()}:{version}'.encode('utf-8')).hexdigest()
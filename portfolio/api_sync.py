@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db.models import Prefetch, Q
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+
+from .models import (
+    Project,
+    Experience,
+    Skill,
+    Achievement,
+    Category,
+    UserProfile,
+    Tombstone,
+)
+from .serializers import (
+    ProjectSerializer,
+    ExperienceSerializer,
+    SkillSerializer,
+    AchievementSerializer,
+    CategorySerializer,
+    UserProfileSerializer,
+)
+
+
+# collection name -> (model, serializer, published filter, related lookups
+# and queryset methods applied to the serialized rows)
+SYNC_COLLECTIONS = {
+    'projects': (
+        Project,
+        ProjectSerializer,
+        Q(is_active=True) & ~Q(status='draft'),
+        {
+            'prefetch': [
+                Prefetch('category', queryset=Category.objects.with_item_counts()),
+                'screenshots',
+            ],
+        },
+    ),
+    'experience': (
+        Experience,
+        ExperienceSerializer,
+        Q(is_active=True, is_draft=False),
+        {'prefetch': ['images']},
+    ),
+    'skills': (Skill, SkillSerializer, Q(is_active=True, is_draft=False), {}),
+    'achievements': (Achievement, AchievementSerializer, Q(is_active=True, is_draft=False), {}),
+    'categories': (Category, CategorySerializer, Q(), {'methods': ['with_item_counts']}),
+    'profile': (UserProfile, UserProfileSerializer, Q(), {}),
+}
+
+SYNC_COLLECTION_NAMES = {model: name for name, (model, *_rest) in SYNC_COLLECTIONS.items()}
+
+
+def get_sync_lag():
+    """Return how far (seconds) next_since trails the time of the pull"""
+    return getattr(settings, 'API_SYNC_LAG_SECONDS', 60)
+
+
+def encode_sync_token(moment):
+    """Return an opaque sync token for a point in time"""
+    return str(int(moment.timestamp() * 1_000_000))
+
+
+def decode_sync_token(token):
+    """Return the point in time a sync token stands for"""
+    try:
+        return datetime.fromtimestamp(int(token) / 1_000_000, tz=dt_timezone.utc)
+    except (TypeError, ValueError, OverflowError, OSError):
+        raise ParseError('Invalid sync token')
+
+
+def record_tombstone(instance):
+    """Remember that an API object was deleted"""
+    collection = SYNC_COLLECTION_NAMES.get(type(instance))
+    if collection is None:
+        return
+    Tombstone.objects.create(
+        collection=collection,
+        object_id=instance.pk,
+        slug=getattr(instance, 'slug', '') or '',
+    )
+
+
+def get_changes(since=None, context=None):
+    """
+    Return everything that changed since a sync token.
+
+    `changes` holds the serialized rows created or updated since then,
+    `deleted` the ids of rows that were deleted or unpublished. Without a
+    token every published row is returned.
+
+    `updated_at` and tombstones are stamped when a row is written, not when
+    the write commits, so a row stamped just before this read may only
+    become visible after it. The new token therefore trails the read by
+    API_SYNC_LAG_SECONDS, and `since` is inclusive: recent rows come again
+    on the next pull instead of being missed, unless their transaction was
+    open for longer than the lag.
+    """
+    next_since = timezone.now() - timedelta(seconds=get_sync_lag())
+    since_moment = decode_sync_token(since) if since else None
+
+    changes = {}
+    deleted = {name: [] for name in SYNC_COLLECTIONS}
+
+    for name, (model, serializer_class, published, related) in SYNC_COLLECTIONS.items():
+        queryset = model.objects.all()
+        if since_moment is not None:
+            queryset = queryset.filter(updated_at__gte=since_moment)
+        if since_moment is not None and published:
+            deleted[name].extend(
+                queryset.exclude(published).values_list('pk', flat=True)
+            )
+
+        rows = queryset.filter(published).order_by('updated_at', 'pk')
+        if related.get('select'):
+            rows = rows.select_related(*related['select'])
+        if related.get('prefetch'):
+            rows = rows.prefetch_related(*related['prefetch'])
+        for method in related.get('methods', ()):
+            rows = getattr(rows, method)()
+        changes[name] = serializer_class(rows, many=True, context=context).data
+
+    if since_moment is not None:
+        tombstones = Tombstone.objects.filter(deleted_at__gte=since_moment)
+        for collection, object_id in tombstones.values_list('collection', 'object_id'):
+            if collection in deleted:
+                deleted[collection].append(object_id)
+
+    return {
+        'since': since,
+        'next_since': encode_sync_token(next_since),
+        'changes': changes,
+        'deleted': deleted,
+    }
@@ -0,0 +1,147 @@
+import os
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from rest_framework.throttling import AnonRateThrottle, SimpleRateThrottle, UserRateThrottle
+
+from .api_keys import APIKeyInfo
+
+
+# Expired rows are deleted after this many writes (per process)
+PRUNE_INTERVAL = 1000
+
+# Admit a request and push its key's theoretical arrival time forward in one
+# statement; no row comes back when the request would exceed the burst.
+ADMIT_SQL = '''
+    INSERT INTO throttle (key, tat) VALUES (:key, :now + :interval)
+    ON CONFLICT (key) DO UPDATE SET tat = max(tat, :now) + :interval
+    WHERE max(tat, :now) + :interval - :now <= :period
+    RETURNING tat
+'''
+
+
+def get_throttle_db_path():
+    """Return the SQLite file the throttle counters are kept in"""
+    return getattr(
+        settings, 'API_THROTTLE_DB', Path(tempfile.gettempdir()) / 'devmitra-throttle.sqlite3'
+    )
+
+
+class ThrottleStore:
+    """
+    GCRA counters in a small SQLite database shared by every worker process.
+
+    Each key holds one number, its theoretical arrival time (TAT). A request
+    is admitted if it fits in the burst (num_requests per duration), which
+    moves the TAT on by duration / num_requests. That is a single
+    INSERT ... ON CONFLICT DO UPDATE ... RETURNING, atomic under SQLite's
+    write lock, so a check costs the same however busy the key is.
+    Connections are per thread and reopened after a fork.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.local = threading.local()
+        self.writes = 0
+
+    def get_connection(self):
+        connection = getattr(self.local, 'connection', None)
+        if connection is None or self.local.pid != os.getpid():
+            connection = sqlite3.connect(
+                self.path or get_throttle_db_path(), timeout=5, isolation_level=None
+            )
+            connection.execute('PRAGMA journal_mode=WAL')
+            # Losing the last few counter updates in a crash is acceptable
+            connection.execute('PRAGMA synchronous=OFF')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS throttle (key TEXT PRIMARY KEY, tat REAL NOT NULL) WITHOUT ROWID'
+            )
+            self.local.connection = connection
+            self.local.pid = os.getpid()
+        return connection
+
+    def admit(self, key, num_requests, duration, now):
+        """
+        Try to admit one request for `key`.
+
+        Returns 0 if it was admitted, otherwise the seconds until it would be.
+        """
+        connection = self.get_connection()
+        interval = duration / num_requests
+        params = {'key': key, 'now': now, 'interval': interval, 'period': duration}
+        if connection.execute(ADMIT_SQL, params).fetchone() is not None:
+            self.writes += 1
+            if self.writes % PRUNE_INTERVAL == 0:
+                connection.execute('DELETE FROM throttle WHERE tat < ?', (now,))
+            return 0
+
+        row = connection.execute('SELECT tat FROM throttle WHERE key = ?', (key,)).fetchone()
+        tat = row[0] if row else now
+        return max(max(tat, now) + interval - now - duration, 0)
+
+
+throttle_store = ThrottleStore()
+
+
+class SharedRateThrottleMixin:
+    """
+    Keeps a SimpleRateThrottle's counters in the shared GCRA store.
+
+    Uses the throttle's own rate, scope and cache key, so the limits set in
+    DEFAULT_THROTTLE_RATES are unchanged; a full burst is allowed and then
+    one request per duration / num_requests.
+    """
+    store = throttle_store
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.wait_time = self.store.admit(self.key, self.num_requests, self.duration, self.timer())
+        return self.wait_time == 0
+
+    def wait(self):
+        return self.wait_time
+
+
+class SharedAnonRateThrottle(SharedRateThrottleMixin, AnonRateThrottle):
+    def get_cache_key(self, request, view):
+        # Requests with an API key use the key's own budget instead
+        if isinstance(request.auth, APIKeyInfo):
+            return None
+        return super().get_cache_key(request, view)
+
+
+class SharedUserRateThrottle(SharedRateThrottleMixin, UserRateThrottle):
+    def get_cache_key(self, request, view):
+        if isinstance(request.auth, APIKeyInfo):
+            return None
+        return super().get_cache_key(request, view)
+
+
+class APIKeyRateThrottle(SharedRateThrottleMixin, SimpleRateThrottle):
+    """
+    Per-key budget for requests authenticated with an API key.
+
+    Uses the key's own rate when it has one, else the `apikey` rate from
+    DEFAULT_THROTTLE_RATES.
+    """
+    scope = 'apikey'
+
+    def allow_request(self, request, view):
+        if not isinstance(request.auth, APIKeyInfo):
+            return True
+        if request.auth.rate:
+            self.rate = request.auth.rate
+            self.num_requests, self.duration = self.parse_rate(self.rate)
+        return super().allow_request(request, view)
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {'scope': self.scope, 'ident': request.auth.id}
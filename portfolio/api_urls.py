@@ -1,4 +1,4 @@
-from django.urls import path, include
+from django.urls import path, re_path, include
 from rest_framework.routers import DefaultRouter
 from . import api_views
 
@@ -9,6 +9,7 @@ router.register(r'experience', api_views.ExperienceViewSet, basename='api-experi
 router.register(r'skills', api_views.SkillViewSet, basename='api-skills')
 router.register(r'achievements', api_views.AchievementViewSet, basename='api-achievements')
 router.register(r'categories', api_views.CategoryViewSet, basename='api-categories')
+router.register(r'technologies', api_views.TechnologyViewSet, basename='api-technologies')
 router.register(r'profile', api_views.UserProfileViewSet, basename='api-profile')
 
 urlpatterns = [
@@ -17,5 +18,14 @@ urlpatterns = [
     
     # Custom endpoints
     path('summary/', api_views.portfolio_summary, name='api-summary'),
+    path('portfolio/', api_views.portfolio_bundle, name='api-portfolio'),
+    path('changes/', api_views.portfolio_changes, name='api-changes'),
+    path('search/', api_views.portfolio_search, name='api-search'),
+    re_path(
+        r'^export/(?P<collection>[\w-]+)\.(?P<export_format>jsonl|json)$',
+        api_views.portfolio_export,
+        name='api-export',
+    ),
     path('health/', api_views.api_health_check, name='api-health'),
+    path('health/ready/', api_views.api_readiness_check, name='api-ready'),
 ]
@@ -1,9 +1,11 @@
 from rest_framework import viewsets, permissions, status
-from rest_framework.decorators import api_view, permission_classes, action
+from rest_framework.decorators import api_view, permission_classes, throttle_classes, action
+from rest_framework.exceptions import NotFound, ParseError
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from django.conf import settings
-from django.db.models import Q
+from django.db.models import Count, Prefetch, Q
+from django.views.decorators.http import condition
 from .models import (
     Project,
     Experience,
@@ -11,7 +13,37 @@ from .models import (
     Achievement,
     Category,
     UserProfile,
+    ProjectScreenshot,
+    ExperienceImage,
+    Technology,
 )
+from .api_async import AsyncReadMixin, run_sync
+from .api_batch import BatchLookupMixin
+from .api_cache import CachedResponseMixin, cache_response
+from .api_cdn import EdgeCacheMixin
+from .api_compression import encoded_response
+from .api_conditional import (
+    ConditionalResponseMixin,
+    arespond_conditionally,
+    conditional_response,
+    get_summary_etag,
+    respond_conditionally,
+)
+from .api_facets import FacetMixin
+from .api_fast import FastListMixin
+from .api_health import get_health
+from .api_keys import APIKeyInfo, get_api_key_required
+from .api_fieldsets import SparseFieldsetMixin, parse_field_list
+from .api_rankings import filter_ranked, rank_queryset
+from .api_export import export_response
+from .api_documents import (
+    aget_portfolio_summary,
+    get_portfolio_document,
+    get_portfolio_etag,
+    get_portfolio_summary,
+)
+from .api_search import get_search_etag, get_search_limit, search
+from .api_sync import get_changes
 from .serializers import (
     ProjectSerializer,
     ExperienceSerializer,
@@ -19,6 +51,7 @@ from .serializers import (
     AchievementSerializer,
     CategorySerializer,
     UserProfileSerializer,
+    TechnologySerializer,
     PortfolioSummarySerializer,
 )
 
@@ -35,31 +68,71 @@ class ReadOnlyPermission(permissions.BasePermission):
 
 class APIKeyPermission(permissions.BasePermission):
     """
-    Custom permission to check for API key in headers.
-    Additional security layer.
+    Check the request's API key against the scope the view needs.
+    
+    Scopes only apply when API_KEY_REQUIRED is set: otherwise every
+    request is allowed, with or without a key, so a key never gets less
+    than no key would. Signed-in (JWT) users are always allowed.
     """
+    scope = 'read'
+    
     def has_permission(self, request, view):
-        api_key = request.headers.get('X-API-Key')
-        # Allow requests without API key for now (optional security)
-        # To enforce: return api_key == settings.API_KEY
-        return True  # Change to enforce API key if needed
+        if not get_api_key_required():
+            return True
+        if isinstance(request.auth, APIKeyInfo):
+            return request.auth.has_scope(self.scope)
+        return request.user.is_authenticated
+
+
+class ExportAPIKeyPermission(APIKeyPermission):
+    """API key check for the bulk export endpoint"""
+    scope = 'export'
 
 
-class ProjectViewSet(viewsets.ReadOnlyModelViewSet):
+class PublicReadOnlyViewSet(EdgeCacheMixin, ConditionalResponseMixin, CachedResponseMixin, FacetMixin, FastListMixin, BatchLookupMixin, SparseFieldsetMixin, AsyncReadMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Base for the public read-only ViewSets, fixing the order of the mixins.
+
+    CDN headers come first, then conditional requests and the response
+    cache, so a 304 or cache hit skips everything that builds the body:
+    facets, the values() list path, batch lookups and sparse fieldsets.
+    Those stay off until a ViewSet sets `facet_fields`, `fast_list = True`
+    (batch lookups: unless it empties `batch_lookup_params`). They are in
+    the base rather than added per ViewSet because mixins a subclass lists
+    would come before the cache layers in the MRO.
+    """
+
+
+class ProjectViewSet(PublicReadOnlyViewSet):
     """
     API endpoint for projects (READ ONLY).
     
     GET /api/projects/ - List all active projects
     GET /api/projects/{id}/ - Get single project
+    GET /api/projects/?slugs=a,b - Get several projects in the given order
+    GET /api/projects/?facets=category,status,technology - Also count matches per value
     GET /api/projects/featured/ - Get featured projects
     """
     serializer_class = ProjectSerializer
-    permission_classes = [ReadOnlyPermission]
+    permission_classes = [ReadOnlyPermission, APIKeyPermission]
+    fast_list = True
+    # Technology: deleting a tag drops it from the technology facet
+    cache_models = (Project, ProjectScreenshot, Category, Technology)
+    surrogate_collection = 'projects'
+    ordering = ('-order', '-created_at')
     lookup_field = 'slug'
+    filter_params = ('category', 'status', 'technology')
+    facet_fields = {
+        'category': ('category__slug', 'category__name'),
+        'status': ('status', None),
+        'technology': ('technology_tags__slug', 'technology_tags__name'),
+    }
     
     def get_queryset(self):
         """Return only active, non-draft projects"""
-        queryset = Project.objects.filter(is_active=True, is_draft=False).select_related('category').prefetch_related('screenshots')
+        queryset = Project.objects.filter(is_active=True).exclude(status='draft').prefetch_related(
+            Prefetch('category', queryset=Category.objects.with_item_counts()), 'screenshots'
+        )
         
         # Filter by category
         category = self.request.query_params.get('category', None)
@@ -71,17 +144,46 @@ class ProjectViewSet(viewsets.ReadOnlyModelViewSet):
         if project_status:
             queryset = queryset.filter(status=project_status)
         
-        return queryset.order_by('-order', '-created_at')
+        # Filter by technology (all given slugs must match)
+        for technology in parse_field_list(self.request.query_params.get('technology')) or []:
+            queryset = queryset.filter(technology_tags__slug=technology)
+        
+        return self.sparse_queryset(queryset.order_by(*self.ordering))
+    
+    def count_technology_facet(self, queryset):
+        """
+        Count projects per technology through the link table.
+        
+        Goes through a pk subquery so a ?technology= filter doesn't also
+        narrow the facet to the filtered technologies.
+        """
+        rows = (
+            Project.technology_tags.through.objects
+            .filter(project__in=queryset.order_by().values('pk'))
+            .values('technology__slug', 'technology__name')
+            .annotate(count=Count('project'))
+            .order_by('-count', 'technology__name')
+        )
+        return [
+            {'value': row['technology__slug'], 'label': row['technology__name'], 'count': row['count']}
+            for row in rows
+        ]
     
     @action(detail=False, methods=['get'])
+    @conditional_response
+    @cache_response
     def featured(self, request):
-        """Get featured projects (status=published, top 6)"""
-        projects = self.get_queryset().filter(status='published')[:6]
+        """Get featured projects (is_featured, by order, top 6)"""
+        if any(param in request.query_params for param in self.filter_params):
+            # The stored list is the top 6 overall; rank the filtered rows instead
+            projects = rank_queryset(self.get_queryset(), 'featured-projects')
+        else:
+            projects = filter_ranked(self.get_queryset(), 'featured-projects')
         serializer = self.get_serializer(projects, many=True)
         return Response(serializer.data)
 
 
-class ExperienceViewSet(viewsets.ReadOnlyModelViewSet):
+class ExperienceViewSet(PublicReadOnlyViewSet):
     """
     API endpoint for experience (READ ONLY).
     
@@ -89,17 +191,23 @@ class ExperienceViewSet(viewsets.ReadOnlyModelViewSet):
     GET /api/experience/{id}/ - Get single experience
     """
     serializer_class = ExperienceSerializer
-    permission_classes = [ReadOnlyPermission]
+    permission_classes = [ReadOnlyPermission, APIKeyPermission]
+    fast_list = True
+    cache_models = (Experience, ExperienceImage)
+    surrogate_collection = 'experience'
+    ordering = ('-start_date',)
     
     def get_queryset(self):
         """Return only active, non-draft experience"""
-        return Experience.objects.filter(
+        queryset = Experience.objects.filter(
             is_active=True, 
             is_draft=False
-        ).prefetch_related('images').order_by('-start_date')
+        ).prefetch_related('images').order_by(*self.ordering)
+        
+        return self.sparse_queryset(queryset)
 
 
-class SkillViewSet(viewsets.ReadOnlyModelViewSet):
+class SkillViewSet(PublicReadOnlyViewSet):
     """
     API endpoint for skills (READ ONLY).
     
@@ -108,28 +216,29 @@ class SkillViewSet(viewsets.ReadOnlyModelViewSet):
     GET /api/skills/top/ - Get top skills by proficiency
     """
     serializer_class = SkillSerializer
-    permission_classes = [ReadOnlyPermission]
+    permission_classes = [ReadOnlyPermission, APIKeyPermission]
+    fast_list = True
+    cache_models = (Skill,)
+    surrogate_collection = 'skills'
+    ordering = ('-proficiency', 'name')
     
     def get_queryset(self):
         """Return only active, non-draft skills"""
-        queryset = Skill.objects.filter(is_active=True, is_draft=False).select_related('category')
-        
-        # Filter by category
-        category = self.request.query_params.get('category', None)
-        if category:
-            queryset = queryset.filter(category__slug=category)
+        queryset = Skill.objects.filter(is_active=True, is_draft=False)
         
-        return queryset.order_by('-proficiency', 'name')
+        return self.sparse_queryset(queryset.order_by(*self.ordering))
     
     @action(detail=False, methods=['get'])
+    @conditional_response
+    @cache_response
     def top(self, request):
         """Get top 10 skills by proficiency"""
-        skills = self.get_queryset()[:10]
+        skills = filter_ranked(self.get_queryset(), 'top-skills')
         serializer = self.get_serializer(skills, many=True)
         return Response(serializer.data)
 
 
-class AchievementViewSet(viewsets.ReadOnlyModelViewSet):
+class AchievementViewSet(PublicReadOnlyViewSet):
     """
     API endpoint for achievements (READ ONLY).
     
@@ -137,21 +246,25 @@ class AchievementViewSet(viewsets.ReadOnlyModelViewSet):
     GET /api/achievements/{id}/ - Get single achievement
     """
     serializer_class = AchievementSerializer
-    permission_classes = [ReadOnlyPermission]
+    permission_classes = [ReadOnlyPermission, APIKeyPermission]
+    fast_list = True
+    cache_models = (Achievement,)
+    surrogate_collection = 'achievements'
+    ordering = ('-achievement_date', '-created_at')
     
     def get_queryset(self):
         """Return only active, non-draft achievements"""
-        queryset = Achievement.objects.filter(is_active=True, is_draft=False).select_related('category')
+        queryset = Achievement.objects.filter(is_active=True, is_draft=False)
         
         # Filter by category
         category = self.request.query_params.get('category', None)
         if category:
-            queryset = queryset.filter(category__slug=category)
+            queryset = queryset.filter(category=category)
         
-        return queryset.order_by('-achievement_date', '-created_at')
+        return self.sparse_queryset(queryset.order_by(*self.ordering))
 
 
-class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
+class CategoryViewSet(PublicReadOnlyViewSet):
     """
     API endpoint for categories (READ ONLY).
     
@@ -159,34 +272,68 @@ class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
     GET /api/categories/{slug}/ - Get single category
     """
     serializer_class = CategorySerializer
-    permission_classes = [ReadOnlyPermission]
+    permission_classes = [ReadOnlyPermission, APIKeyPermission]
+    fast_list = True
+    cache_models = (Category, Project)
+    surrogate_collection = 'categories'
+    ordering = ('category_type', 'name')
     lookup_field = 'slug'
     
     def get_queryset(self):
         """Return all categories"""
-        queryset = Category.objects.all()
+        queryset = Category.objects.with_item_counts()
         
         # Filter by type
         category_type = self.request.query_params.get('type', None)
         if category_type:
             queryset = queryset.filter(category_type=category_type)
         
-        return queryset.order_by('category_type', 'name')
+        return self.sparse_queryset(queryset.order_by(*self.ordering))
 
 
-class UserProfileViewSet(viewsets.ReadOnlyModelViewSet):
+class TechnologyViewSet(PublicReadOnlyViewSet):
+    """
+    API endpoint for technologies (READ ONLY).
+    
+    GET /api/technologies/ - Technologies used by published projects, with counts
+    GET /api/technologies/{slug}/ - Get single technology
+    """
+    serializer_class = TechnologySerializer
+    permission_classes = [ReadOnlyPermission, APIKeyPermission]
+    fast_list = True
+    cache_models = (Technology, Project)
+    surrogate_collection = 'technologies'
+    ordering = ('name',)
+    lookup_field = 'slug'
+    
+    def get_queryset(self):
+        """Return technologies with their published project count"""
+        published = Q(projects__is_active=True) & ~Q(projects__status='draft')
+        queryset = Technology.objects.annotate(
+            project_count=Count('projects', filter=published)
+        ).filter(project_count__gt=0)
+        
+        return self.sparse_queryset(queryset.order_by(*self.ordering))
+
+
+class UserProfileViewSet(PublicReadOnlyViewSet):
     """
     API endpoint for user profile (READ ONLY).
     
     GET /api/profile/ - Get user profile
     """
     serializer_class = UserProfileSerializer
-    permission_classes = [ReadOnlyPermission]
+    permission_classes = [ReadOnlyPermission, APIKeyPermission]
+    cache_models = (UserProfile,)
+    surrogate_collection = 'profile'
+    batch_lookup_params = {}
     
     def get_queryset(self):
         """Return user profile (only one)"""
         return UserProfile.objects.all()[:1]
     
+    @conditional_response
+    @cache_response
     def list(self, request, *args, **kwargs):
         """Return single profile instead of list"""
         profile = UserProfile.objects.first()
@@ -194,43 +341,177 @@ class UserProfileViewSet(viewsets.ReadOnlyModelViewSet):
             serializer = self.get_serializer(profile)
             return Response(serializer.data)
         return Response({}, status=status.HTTP_404_NOT_FOUND)
+    
+    @conditional_response
+    @cache_response
+    async def alist(self, request, *args, **kwargs):
+        profile = await UserProfile.objects.afirst()
+        if profile:
+            serializer = self.get_serializer(profile)
+            return Response(serializer.data)
+        return Response({}, status=status.HTTP_404_NOT_FOUND)
 
 
 @api_view(['GET'])
-@permission_classes([ReadOnlyPermission])
+@permission_classes([ReadOnlyPermission, APIKeyPermission])
+@condition(etag_func=get_summary_etag)
 def portfolio_summary(request):
     """
     Get portfolio summary statistics.
     
     GET /api/summary/ - Get overall portfolio stats
     """
-    data = {
-        'total_projects': Project.objects.count(),
-        'total_experience': Experience.objects.count(),
-        'total_skills': Skill.objects.count(),
-        'total_achievements': Achievement.objects.count(),
-        'active_projects': Project.objects.filter(is_active=True, is_draft=False).count(),
-        'active_experience': Experience.objects.filter(is_active=True, is_draft=False).count(),
-        'active_skills': Skill.objects.filter(is_active=True, is_draft=False).count(),
-        'active_achievements': Achievement.objects.filter(is_active=True, is_draft=False).count(),
-        'years_of_experience': UserProfile.objects.first().experience_years if UserProfile.objects.first() else 0,
-    }
-    
-    serializer = PortfolioSummarySerializer(data)
+    serializer = PortfolioSummarySerializer(get_portfolio_summary())
     return Response(serializer.data)
 
 
+async def aportfolio_summary(view, request):
+    """portfolio_summary for the async URLconf"""
+    async def get_response():
+        serializer = PortfolioSummarySerializer(await aget_portfolio_summary())
+        return Response(serializer.data)
+
+    etag = '"%s"' % await run_sync(get_summary_etag, request)
+    return await arespond_conditionally(request, etag, None, get_response)
+
+
+@api_view(['GET'])
+@permission_classes([ReadOnlyPermission, APIKeyPermission])
+def portfolio_bundle(request):
+    """
+    Get all published portfolio content in one document.
+    
+    GET /api/portfolio/ - Profile, projects, experience, skills,
+    achievements and summary, prebuilt whenever content changes
+    """
+    return respond_conditionally(
+        request, get_portfolio_etag(), None,
+        lambda: encoded_response(request, 'application/json', get_portfolio_document()),
+    )
+
+
+@api_view(['GET'])
+@permission_classes([ReadOnlyPermission, APIKeyPermission])
+def portfolio_changes(request):
+    """
+    Get everything that changed since a sync token.
+    
+    GET /api/changes/ - Full snapshot plus a `next_since` token
+    GET /api/changes/?since=<token> - Rows created/updated since the token
+    and the ids of rows deleted or unpublished since then
+    """
+    return Response(get_changes(request.query_params.get('since'), {'request': request}))
+
+
+@api_view(['GET'])
+@permission_classes([ReadOnlyPermission, APIKeyPermission])
+@condition(etag_func=get_search_etag)
+def portfolio_search(request):
+    """
+    Full-text search across published projects, skills, experience and achievements.
+    
+    GET /api/search/?q=django - Best matches first, with highlighted snippets
+    GET /api/search/?q=django&type=projects,skills - Only the given types
+    """
+    try:
+        limit = min(int(request.query_params.get('limit', 20)), get_search_limit())
+    except ValueError:
+        raise ParseError('Invalid limit')
+
+    query = request.query_params.get('q', '')
+    collections = parse_field_list(request.query_params.get('type'))
+    return Response({
+        'query': query,
+        'results': search(query, collections, max(limit, 1)),
+    })
+
+
+# collection name -> list endpoint streamed by /api/export/
+EXPORT_VIEWSETS = {
+    'projects': ProjectViewSet,
+    'experience': ExperienceViewSet,
+    'skills': SkillViewSet,
+    'achievements': AchievementViewSet,
+    'categories': CategoryViewSet,
+    'technologies': TechnologyViewSet,
+}
+
+
+@api_view(['GET'])
+@permission_classes([ReadOnlyPermission, ExportAPIKeyPermission])
+def portfolio_export(request, collection, export_format):
+    """
+    Stream every published row of a collection in one response.
+    
+    GET /api/export/projects.jsonl - One JSON object per line
+    GET /api/export/projects.json - One JSON array
+    Accepts the same filters as the collection's list endpoint.
+    """
+    viewset = EXPORT_VIEWSETS.get(collection)
+    if viewset is None:
+        raise NotFound('Unknown collection')
+    return export_response(viewset, request, collection, export_format)
+
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
+@throttle_classes([])
 def api_health_check(request):
     """
     Health check endpoint to verify API is running.
     
     GET /api/health/ - Check API health
+    GET /api/health/?deep=1 - Also check the database, cache and media
+    storage and report their latencies (503 if any check fails)
     """
-    return Response({
+    return health_check_response(get_health() if is_deep_health_check(request) else None)
+
+
+async def aapi_health_check(view, request):
+    """api_health_check for the async URLconf (deep checks run in the sync pool)"""
+    return health_check_response(await run_sync(get_health) if is_deep_health_check(request) else None)
+
+
+def is_deep_health_check(request):
+    return request.query_params.get('deep') not in (None, '', '0', 'false')
+
+
+def health_check_response(health=None):
+    """Build the health check response, with `health` from get_health() for deep checks"""
+    data = {
         'status': 'healthy',
         'message': 'Portfolio API is running',
         'version': '1.0.0',
         'read_only': True,
-    })
+    }
+    if health is not None:
+        data['status'] = 'healthy' if health['healthy'] else 'unhealthy'
+        data['checks'] = health['checks']
+        if not health['healthy']:
+            return Response(data, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+    return Response(data)
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+@throttle_classes([])
+def api_readiness_check(request):
+    """
+    Readiness probe for load balancers.
+    
+    GET /api/health/ready/ - 200 if the database, cache and media storage
+    respond, else 503; checks are reused for API_HEALTH_CACHE_SECONDS
+    """
+    return readiness_response(get_health())
+
+
+async def aapi_readiness_check(view, request):
+    """api_readiness_check for the async URLconf"""
+    return readiness_response(await run_sync(get_health))
+
+
+def readiness_response(health):
+    return Response(
+        {'ready': health['healthy'], 'checks': health['checks']},
+        status=status.HTTP_200_OK if health['healthy'] else status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
@@ -0,0 +1,211 @@
+import asyncio
+import io
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from urllib.parse import urlsplit
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.backends.utils import CursorWrapper
+
+from portfolio.api_throttling import SharedRateThrottleMixin
+from portfolio.models import Project, Skill
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare concurrent throughput of the API read endpoints through the "
+        "WSGI application (sync views on a fixed pool of server threads) and "
+        "the ASGI application (async views on one event loop). Both are "
+        "called in-process, without a server"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests", type=int, default=400, help="Requests per endpoint and handler"
+        )
+        parser.add_argument(
+            "--concurrency", type=int, default=64, help="Clients with a request in flight"
+        )
+        parser.add_argument(
+            "--threads", type=int, default=8, help="WSGI server threads"
+        )
+        parser.add_argument(
+            "--query-latency",
+            type=float,
+            default=0,
+            help="Milliseconds added to every database query (e.g. a database across the network)",
+        )
+        parser.add_argument(
+            "--host", default="localhost", help="Host header (must be in ALLOWED_HOSTS)"
+        )
+        parser.add_argument(
+            "--cold",
+            action="store_true",
+            help="Clear the cache before each run, so the first requests build the responses",
+        )
+
+    def get_paths(self):
+        paths = [
+            "/api/projects/",
+            "/api/projects/?facets=category,status",
+            "/api/skills/",
+            "/api/profile/",
+            "/api/summary/",
+            "/api/health/",
+        ]
+        project = Project.objects.filter(is_active=True).exclude(status="draft").exclude(slug="").first()
+        if project is not None:
+            paths.append(f"/api/projects/{project.slug}/")
+        skill = Skill.objects.filter(is_active=True, is_draft=False).first()
+        if skill is not None:
+            paths.append(f"/api/skills/{skill.pk}/")
+        return paths
+
+    def handle(self, *args, **options):
+        if min(options["requests"], options["concurrency"], options["threads"]) < 1:
+            raise CommandError("--requests, --concurrency and --threads must be positive")
+
+        from config.asgi import application as asgi_application
+        from config.wsgi import application as wsgi_application
+
+        self.asgi_application = asgi_application
+        self.wsgi_application = wsgi_application
+        self.host = options["host"]
+        # Throttling would reject most of the run; both handlers share the
+        # same authentication, permission and cache work otherwise.
+        with mock.patch.object(SharedRateThrottleMixin, "allow_request", return_value=True), \
+                self.add_query_latency(options["query_latency"] / 1000):
+            self.run_benchmark(options)
+
+    def add_query_latency(self, seconds):
+        execute = CursorWrapper.execute
+
+        def slow_execute(cursor, *args, **kwargs):
+            time.sleep(seconds)
+            return execute(cursor, *args, **kwargs)
+
+        return mock.patch.object(CursorWrapper, "execute", slow_execute if seconds else execute)
+
+    def run_benchmark(self, options):
+        mismatches = []
+        self.stdout.write(
+            f"{options['requests']} requests per endpoint from {options['concurrency']} clients, "
+            f"{options['threads']} WSGI threads, {options['query_latency']} ms added per query\n"
+        )
+        self.stdout.write(f"{'endpoint':<40} {'handler':<6} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8}")
+
+        for path in self.get_paths():
+            results = {}
+            for name, fetch in (("wsgi", self.get_wsgi_fetch(path, options["threads"])), ("asgi", self.get_asgi_fetch(path))):
+                if options["cold"]:
+                    cache.clear()
+                start = time.perf_counter()
+                responses, latencies = self.run_clients(fetch, options["requests"], options["concurrency"])
+                elapsed = time.perf_counter() - start
+                results[name] = responses[0]
+                latencies.sort()
+                self.stdout.write(
+                    f"{path:<40} {name:<6} {len(latencies) / elapsed:9.0f} "
+                    f"{statistics.median(latencies) * 1000:8.2f} "
+                    f"{latencies[int(len(latencies) * 0.95) - 1] * 1000:8.2f}"
+                )
+                if len(set(responses)) != 1:
+                    mismatches.append(f"{path} ({name}: responses differ between requests)")
+            if results["wsgi"] != results["asgi"]:
+                mismatches.append(f"{path} (wsgi and asgi responses differ)")
+
+        if mismatches:
+            raise CommandError("Responses differ for: " + ", ".join(mismatches))
+        self.stdout.write(self.style.SUCCESS("\n✅ Sync and async views returned the same responses"))
+
+    def run_clients(self, fetch, requests, concurrency):
+        """Send `requests` requests, `concurrency` at a time; return (responses, latencies)"""
+        async def client(semaphore):
+            async with semaphore:
+                started = time.perf_counter()
+                response = await fetch()
+                return response, time.perf_counter() - started
+
+        async def run():
+            semaphore = asyncio.Semaphore(concurrency)
+            return await asyncio.gather(*(client(semaphore) for _ in range(requests)))
+
+        results = asyncio.run(run())
+        return [response for response, _ in results], [latency for _, latency in results]
+
+    def get_wsgi_fetch(self, path, threads):
+        """Return a fetch() queueing the request for a WSGI server thread"""
+        url = urlsplit(path)
+        executor = ThreadPoolExecutor(max_workers=threads)
+
+        def handle():
+            environ = {
+                "REQUEST_METHOD": "GET",
+                "PATH_INFO": url.path,
+                "QUERY_STRING": url.query,
+                "SCRIPT_NAME": "",
+                "SERVER_NAME": self.host,
+                "SERVER_PORT": "80",
+                "SERVER_PROTOCOL": "HTTP/1.1",
+                "HTTP_HOST": self.host,
+                "wsgi.input": io.BytesIO(b""),
+                "wsgi.errors": sys.stderr,
+                "wsgi.url_scheme": "http",
+            }
+            status = []
+            body = self.wsgi_application(environ, lambda code, headers: status.append(int(code[:3])))
+            try:
+                return status[0], b"".join(body)
+            finally:
+                body.close()
+                # Server threads outlive the run; don't keep their connections
+                connections.close_all()
+
+        async def fetch():
+            return await asyncio.get_running_loop().run_in_executor(executor, handle)
+
+        return fetch
+
+    def get_asgi_fetch(self, path):
+        """Return a fetch() passing the request to the ASGI application"""
+        url = urlsplit(path)
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": url.path,
+            "raw_path": url.path.encode(),
+            "query_string": url.query.encode(),
+            "root_path": "",
+            "headers": [(b"host", self.host.encode())],
+            "client": ("127.0.0.1", 50000),
+            "server": (self.host, 80),
+        }
+
+        async def fetch():
+            messages = []
+            received = False
+
+            async def receive():
+                nonlocal received
+                if received:
+                    # The client stays connected until the response is sent
+                    await asyncio.Future()
+                received = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+
+            async def send(message):
+                messages.append(message)
+
+            await self.asgi_application(dict(scope), receive, send)
+            body = b"".join(message.get("body", b"") for message in messages[1:])
+            return messages[0]["status"], body
+
+        return fetch
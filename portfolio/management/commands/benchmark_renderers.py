@@ -0,0 +1,65 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from portfolio.api_renderers import FastJSONRenderer, MessagePackRenderer, msgpack, orjson
+from portfolio.models import Project, UserProfile
+from portfolio.serializers import ProjectSerializer, UserProfileSerializer
+
+
+class Command(BaseCommand):
+    help = "Compare API renderer speed and size on a large project list"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--size", type=int, default=2000, help="Number of projects in the list"
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=20, help="Renders per renderer"
+        )
+
+    def handle(self, *args, **options):
+        projects = ProjectSerializer(
+            Project.objects.select_related("category").prefetch_related("screenshots"),
+            many=True,
+        ).data
+        if not projects:
+            raise CommandError("No projects found. Run `manage.py populate_data` first.")
+
+        # Repeat the real rows up to the requested size, and include the
+        # profile so Decimal (hourly_rate) values are exercised too.
+        rows = [projects[index % len(projects)] for index in range(options["size"])]
+        profile = UserProfile.objects.first()
+        data = {
+            "results": rows,
+            "profile": UserProfileSerializer(profile).data if profile else None,
+        }
+
+        renderers = [("DRF JSONRenderer", JSONRenderer())]
+        if orjson is not None:
+            renderers.append(("FastJSONRenderer (orjson)", FastJSONRenderer()))
+        else:
+            self.stdout.write(self.style.WARNING("orjson not installed, skipping FastJSONRenderer"))
+        if msgpack is not None:
+            renderers.append(("MessagePackRenderer", MessagePackRenderer()))
+        else:
+            self.stdout.write(self.style.WARNING("msgpack not installed, skipping MessagePackRenderer"))
+
+        self.stdout.write(
+            f"Rendering {len(rows)} projects x {options['repeat']} runs\n"
+        )
+        baseline = None
+        for name, renderer in renderers:
+            body = renderer.render(data, renderer.media_type, {})
+            start = time.perf_counter()
+            for _ in range(options["repeat"]):
+                renderer.render(data, renderer.media_type, {})
+            elapsed = (time.perf_counter() - start) / options["repeat"] * 1000
+            baseline = baseline or elapsed
+            self.stdout.write(
+                f"{name:<28} {elapsed:8.2f} ms/render  {len(body):>10,} bytes  "
+                f"{baseline / elapsed:5.1f}x"
+            )
+
+        self.stdout.write(self.style.SUCCESS("\n✅ Benchmark complete"))
@@ -0,0 +1,115 @@
+import time
+
+from django.db import connection, transaction
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+
+from portfolio.api_renderers import dumps_json
+from portfolio.api_urls import router
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Check that the values() fast list path renders the same JSON as the "
+        "serializers, and compare their speed"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--size",
+            type=int,
+            default=0,
+            help="Clone rows (inside a rolled-back transaction) until each list has this many",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=10, help="Runs per serialization path"
+        )
+        parser.add_argument(
+            "--host", default="localhost", help="Host for absolute media URLs (in ALLOWED_HOSTS)"
+        )
+
+    def handle(self, *args, **options):
+        self.factory = APIRequestFactory(HTTP_HOST=options["host"])
+        mismatches = []
+        try:
+            with transaction.atomic():
+                for prefix, viewset, _basename in router.registry:
+                    if getattr(viewset, "fast_list", False):
+                        if not self.compare(prefix, viewset, options):
+                            mismatches.append(prefix)
+                raise Rollback()
+        except Rollback:
+            pass
+
+        if mismatches:
+            raise CommandError(f"Fast path output differs for: {', '.join(mismatches)}")
+        self.stdout.write(self.style.SUCCESS("\n✅ Fast path output matches the serializers"))
+
+    def get_view(self, prefix, viewset):
+        view = viewset()
+        view.action_map = {"get": "list"}
+        view.action = "list"
+        view.format_kwarg = None
+        view.args, view.kwargs = (), {}
+        view.request = view.initialize_request(self.factory.get(f"/api/{prefix}/"))
+        return view
+
+    def clone_rows(self, model, size):
+        """Bulk-create copies of existing rows (no signals) up to `size` rows"""
+        originals = list(model.objects.all())
+        if not originals:
+            return
+        fields = [field for field in model._meta.concrete_fields if not field.primary_key]
+        clones = []
+        for index in range(max(size - len(originals), 0)):
+            original = originals[index % len(originals)]
+            clone = model(**{field.attname: getattr(original, field.attname) for field in fields})
+            if hasattr(clone, "slug"):
+                clone.slug = f"{original.slug}-bench-{index}"
+            clones.append(clone)
+        model.objects.bulk_create(clones, batch_size=500)
+
+    def compare(self, prefix, viewset, options):
+        view = self.get_view(prefix, viewset)
+        model = view.get_queryset().model
+        if options["size"]:
+            self.clone_rows(model, options["size"])
+
+        queryset = view.filter_queryset(view.get_queryset())
+        fast = view.get_fast_serializer(queryset)
+        if fast is None:
+            self.stdout.write(self.style.WARNING(f"{prefix:<14} fast path not supported"))
+            return True
+
+        def slow_path():
+            return view.get_serializer(view.filter_queryset(view.get_queryset()), many=True).data
+
+        def fast_path():
+            return fast.serialize(fast.values(view.filter_queryset(view.get_queryset())))
+
+        results = {}
+        for name, path in (("serializer", slow_path), ("values()", fast_path)):
+            with CaptureQueriesContext(connection) as queries:
+                body = dumps_json(path())
+            start = time.perf_counter()
+            for _ in range(options["repeat"]):
+                path()
+            elapsed = (time.perf_counter() - start) / options["repeat"] * 1000
+            results[name] = (body, elapsed, len(queries))
+
+        slow_body, slow_ms, slow_queries = results["serializer"]
+        fast_body, fast_ms, fast_queries = results["values()"]
+        matches = slow_body == fast_body
+        rows = queryset.count()
+        self.stdout.write(
+            f"{prefix:<14} {rows:>6} rows  serializer {slow_ms:8.2f} ms ({slow_queries} queries)  "
+            f"values() {fast_ms:8.2f} ms ({fast_queries} queries)  "
+            f"{slow_ms / fast_ms if fast_ms else 0:5.1f}x  "
+            + (self.style.SUCCESS("identical") if matches else self.style.ERROR("DIFFERENT"))
+        )
+        return matches
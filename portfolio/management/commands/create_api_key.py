@@ -0,0 +1,25 @@
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio.models import APIKey
+
+
+class Command(BaseCommand):
+    help = "Issue an API key to a consumer and print it (only its hash is stored)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("name", help="Who the key is for")
+        parser.add_argument("--scopes", default="read", help="Comma-separated scopes (read, export, *)")
+        parser.add_argument("--rate", default="", help="Rate limit for this key, e.g. 5000/hour")
+
+    def handle(self, *args, **options):
+        api_key = APIKey(name=options["name"], scopes=options["scopes"], rate=options["rate"])
+        raw_key = api_key.set_key()
+        try:
+            api_key.full_clean()
+        except ValidationError as exc:
+            raise CommandError("; ".join(exc.messages))
+        api_key.save()
+
+        self.stdout.write(raw_key)
+        self.stdout.write(self.style.SUCCESS(f"✅ Created API key for {api_key.name} ({api_key.prefix}…)"))
@@ -0,0 +1,211 @@
+import hashlib
+import json
+import os
+import shutil
+from urllib.parse import parse_qs, urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from django.urls import resolve
+from django.utils import timezone
+
+from portfolio.api_compression import compress_variants
+from portfolio.api_urls import router
+
+
+# Non-router endpoints included in the snapshot
+EXTRA_PATHS = ["/api/summary/", "/api/portfolio/"]
+
+# File suffix for each stored encoding
+ENCODING_SUFFIXES = {"identity": "", "gzip": ".gz", "br": ".br"}
+
+MANIFEST_NAME = "manifest.json"
+
+
+class Command(BaseCommand):
+    help = "Render the public read API to static JSON files for nginx"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "output",
+            help="Snapshot path; becomes a symlink to the current snapshot directory",
+        )
+        parser.add_argument(
+            "--base-url",
+            default="http://localhost:8000",
+            help="Scheme and host used for absolute URLs (must be in ALLOWED_HOSTS)",
+        )
+        parser.add_argument(
+            "--keep",
+            type=int,
+            default=1,
+            help="Number of previous snapshot directories to keep",
+        )
+
+    def handle(self, *args, **options):
+        output = os.path.abspath(options["output"].rstrip("/"))
+        if os.path.exists(output) and not os.path.islink(output):
+            raise CommandError(f"{output} exists and is not a snapshot symlink.")
+
+        base = urlsplit(options["base_url"])
+        self.factory = RequestFactory(
+            HTTP_HOST=base.netloc,
+            HTTP_ACCEPT="application/json",
+            **{"wsgi.url_scheme": base.scheme or "http"},
+        )
+
+        previous_dir = os.path.realpath(output) if os.path.islink(output) else None
+        previous = self.read_manifest(previous_dir)
+
+        snapshot_dir = f"{output}.{timezone.now():%Y%m%d%H%M%S%f}"
+        os.makedirs(snapshot_dir)
+        files = {}
+        written = reused = 0
+
+        try:
+            for url_path, content in self.render_endpoints():
+                relative = self.file_path(url_path)
+                digest = hashlib.sha256(content).hexdigest()
+                entry = previous.get(relative)
+
+                if entry and entry["sha256"] == digest:
+                    self.link_previous(previous_dir, snapshot_dir, relative, entry)
+                    files[relative] = entry
+                    reused += 1
+                    continue
+
+                files[relative] = self.write_file(snapshot_dir, relative, content, digest)
+                written += 1
+
+            manifest = {"generated_at": timezone.now().isoformat(), "files": files}
+            with open(os.path.join(snapshot_dir, MANIFEST_NAME), "w") as fh:
+                json.dump(manifest, fh, indent=2, sort_keys=True)
+        except BaseException:
+            # Leave the live snapshot untouched
+            shutil.rmtree(snapshot_dir, ignore_errors=True)
+            raise
+
+        self.swap(output, snapshot_dir)
+        self.prune(output, snapshot_dir, options["keep"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Snapshot {snapshot_dir}: {written} written, {reused} unchanged"
+            )
+        )
+
+    def render_endpoints(self):
+        """Yield (url path with query, body) for every public read endpoint"""
+        for prefix, viewset, _basename in router.registry:
+            list_path = f"/api/{prefix}/"
+            lookup_key = "id" if viewset.lookup_field == "pk" else viewset.lookup_field
+            lookups = []
+
+            path = list_path
+            while path:
+                content = self.render(path)
+                yield path, content
+                data = json.loads(content)
+                if not isinstance(data, dict) or "results" not in data:
+                    break
+                lookups.extend(row[lookup_key] for row in data["results"])
+                path = self.relative_url(data["next"])
+
+            for action in viewset.get_extra_actions():
+                if not action.detail:
+                    path = f"{list_path}{action.url_path}/"
+                    yield path, self.render(path)
+
+            for lookup in lookups:
+                if lookup in (None, ""):
+                    self.stdout.write(
+                        self.style.WARNING(f"Skipping {prefix} row without a {lookup_key}")
+                    )
+                    continue
+                path = f"{list_path}{lookup}/"
+                yield path, self.render(path)
+
+        for path in EXTRA_PATHS:
+            yield path, self.render(path)
+
+    def render(self, path):
+        """Render one endpoint without throttling and return its JSON body"""
+        split = urlsplit(path)
+        match = resolve(split.path)
+        func = match.func
+        initkwargs = {**getattr(func, "initkwargs", {}), "throttle_classes": ()}
+        if getattr(func, "actions", None):
+            view = func.cls.as_view(func.actions, **initkwargs)
+        else:
+            view = func.cls.as_view(**initkwargs)
+
+        response = view(self.factory.get(path), *match.args, **match.kwargs)
+        if hasattr(response, "render"):
+            response.render()
+        if response.status_code != 200:
+            raise CommandError(f"{path} returned {response.status_code}")
+        return response.content
+
+    def relative_url(self, url):
+        if not url:
+            return None
+        split = urlsplit(url)
+        return f"{split.path}?{split.query}" if split.query else split.path
+
+    def file_path(self, url_path):
+        """
+        Map a URL to its file, e.g. /api/projects/?cursor=abc ->
+        api/projects/page-abc.json (the first page is index.json).
+        """
+        split = urlsplit(url_path)
+        cursor = parse_qs(split.query).get("cursor", [None])[0]
+        name = f"page-{cursor}.json" if cursor else "index.json"
+        return os.path.join(split.path.strip("/"), name)
+
+    def write_file(self, snapshot_dir, relative, content, digest):
+        """Write a body and its precompressed siblings"""
+        target = os.path.join(snapshot_dir, relative)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        entry = {"sha256": digest, "bytes": len(content), "encodings": {}}
+        for encoding, body in compress_variants(content).items():
+            with open(target + ENCODING_SUFFIXES[encoding], "wb") as fh:
+                fh.write(body)
+            entry["encodings"][encoding] = len(body)
+        return entry
+
+    def link_previous(self, previous_dir, snapshot_dir, relative, entry):
+        """Hard-link an unchanged file (and siblings) from the previous snapshot"""
+        target = os.path.join(snapshot_dir, relative)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        for encoding in entry["encodings"]:
+            suffix = ENCODING_SUFFIXES[encoding]
+            os.link(os.path.join(previous_dir, relative) + suffix, target + suffix)
+
+    def read_manifest(self, snapshot_dir):
+        if not snapshot_dir:
+            return {}
+        try:
+            with open(os.path.join(snapshot_dir, MANIFEST_NAME)) as fh:
+                return json.load(fh)["files"]
+        except (OSError, ValueError, KeyError):
+            return {}
+
+    def swap(self, output, snapshot_dir):
+        """Atomically point the output symlink at the new snapshot"""
+        temporary = f"{output}.swap"
+        if os.path.lexists(temporary):
+            os.remove(temporary)
+        os.symlink(os.path.basename(snapshot_dir), temporary)
+        os.replace(temporary, output)
+
+    def prune(self, output, current_dir, keep):
+        """Remove old snapshot directories beyond `keep`"""
+        parent, name = os.path.split(output)
+        snapshots = sorted(
+            entry
+            for entry in os.listdir(parent)
+            if entry.startswith(f"{name}.") and entry != os.path.basename(current_dir)
+            and entry[len(name) + 1:].isdigit()
+        )
+        for entry in snapshots[:max(len(snapshots) - keep, 0)]:
+            shutil.rmtree(os.path.join(parent, entry))
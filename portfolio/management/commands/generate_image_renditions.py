@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from portfolio.api_images import RENDITION_FIELDS, update_renditions
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate the resized copies of uploaded images that have none (e.g. "
+        "uploaded before renditions existed)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate every image (e.g. after changing API_IMAGE_RENDITION_WIDTHS)",
+        )
+
+    def handle(self, *args, **options):
+        count = 0
+        for model, names in RENDITION_FIELDS.items():
+            for instance in model.objects.iterator():
+                previous = {name: getattr(instance, f"{name}_renditions") for name in names}
+                update_renditions(instance, force=options["force"])
+                if any(getattr(instance, f"{name}_renditions") != previous[name] for name in names):
+                    # A full save, so API caches and delta-sync clients see the change
+                    instance.save()
+                    count += 1
+        self.stdout.write(self.style.SUCCESS(f"✅ Updated renditions of {count} objects"))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from portfolio.api_rankings import rebuild_ranked_lists
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the featured projects and top skills lists (needed after bulk "
+        "updates that skip model signals)"
+    )
+
+    def handle(self, *args, **options):
+        count = rebuild_ranked_lists()
+        self.stdout.write(self.style.SUCCESS(f"✅ Rebuilt {count} ranked lists"))
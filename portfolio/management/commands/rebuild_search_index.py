@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio.api_search import SearchUnavailable, rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index from published content"
+
+    def handle(self, *args, **options):
+        try:
+            count = rebuild_search_index()
+        except SearchUnavailable as exc:
+            raise CommandError(str(exc.detail))
+        self.stdout.write(self.style.SUCCESS(f"✅ Indexed {count} objects"))
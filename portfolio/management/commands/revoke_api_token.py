@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import UntypedToken
+
+from portfolio.api_auth import revoke_token
+
+
+class Command(BaseCommand):
+    help = "Revoke a JWT so stateless authentication rejects it until it expires"
+
+    def add_arguments(self, parser):
+        parser.add_argument("token", help="The encoded token")
+
+    def handle(self, *args, **options):
+        try:
+            token = UntypedToken(options["token"])
+        except TokenError as exc:
+            raise CommandError(f"Invalid token: {exc}")
+
+        revoke_token(token)
+        self.stdout.write(self.style.SUCCESS(f"✅ Revoked token {token['jti']}"))
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0012_notification'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='achievement',
+            index=models.Index(fields=['-achievement_date', '-created_at', '-id'], name='achievement_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['category_type', 'name', 'id'], name='category_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['-start_date', '-id'], name='experience_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-order', '-created_at', '-id'], name='project_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['-proficiency', 'name', 'id'], name='skill_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,64 @@
+from django.db import migrations
+
+
+# collection, table, title column, body columns, published condition
+SEARCH_SOURCES = [
+    (
+        'projects',
+        'portfolio_project',
+        'title',
+        ['description', 'technologies', 'documentation'],
+        "is_active AND status != 'draft'",
+    ),
+    ('skills', 'portfolio_skill', 'name', ['description'], 'is_active AND NOT is_draft'),
+    (
+        'experience',
+        'portfolio_experience',
+        'position',
+        ['company_name', 'short_description'],
+        'is_active AND NOT is_draft',
+    ),
+    (
+        'achievements',
+        'portfolio_achievement',
+        'title',
+        ['issuing_organization', 'short_description'],
+        'is_active AND NOT is_draft',
+    ),
+]
+
+
+def create_search_index(apps, schema_editor):
+    """Create the FTS5 table and index existing published rows (SQLite only)"""
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+
+    schema_editor.execute(
+        'CREATE VIRTUAL TABLE IF NOT EXISTS portfolio_search USING fts5('
+        'collection UNINDEXED, object_id UNINDEXED, slug UNINDEXED, title, body, '
+        "tokenize = 'porter unicode61 remove_diacritics 2')"
+    )
+    for collection, table, title, body, published in SEARCH_SOURCES:
+        body_sql = " || char(10) || ".join(f"COALESCE({column}, '')" for column in body)
+        schema_editor.execute(
+            'INSERT INTO portfolio_search (collection, object_id, slug, title, body) '
+            f"SELECT '{collection}', id, COALESCE(slug, ''), COALESCE({title}, ''), {body_sql} "
+            f'FROM {table} WHERE {published}'
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute('DROP TABLE IF EXISTS portfolio_search')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0014_tombstone'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
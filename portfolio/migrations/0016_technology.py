@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0015_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Technology',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('slug', models.SlugField(max_length=120, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Technologies',
+                'ordering': ['name'],
+                'indexes': [models.Index(fields=['name', 'id'], name='technology_keyset_idx')],
+            },
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='technology_tags',
+            field=models.ManyToManyField(blank=True, help_text='Kept in sync with the technologies field on save', related_name='projects', to='portfolio.technology'),
+        ),
+    ]
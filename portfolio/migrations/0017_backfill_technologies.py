@@ -0,0 +1,35 @@
+from django.db import migrations
+from django.utils.text import slugify
+
+
+def technology_slug(name):
+    return slugify(name.replace('+', ' plus ').replace('#', ' sharp '), allow_unicode=True)
+
+
+def backfill_technologies(apps, schema_editor):
+    """Create Technology rows from the comma-separated field and link them"""
+    Project = apps.get_model('portfolio', 'Project')
+    Technology = apps.get_model('portfolio', 'Technology')
+
+    technologies = {tech.slug: tech for tech in Technology.objects.all()}
+    for project in Project.objects.only('pk', 'technologies'):
+        tags = {}
+        for name in (project.technologies or '').split(','):
+            slug = technology_slug(name)
+            if not slug:
+                continue
+            if slug not in technologies:
+                technologies[slug] = Technology.objects.create(slug=slug, name=name.strip())
+            tags[slug] = technologies[slug]
+        project.technology_tags.set(tags.values())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0016_technology'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_technologies, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0017_backfill_technologies'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='APIKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Who the key was issued to', max_length=100)),
+                ('prefix', models.CharField(editable=False, help_text='First characters of the key', max_length=8)),
+                ('key_hash', models.CharField(editable=False, max_length=64, unique=True)),
+                ('scopes', models.CharField(default='read', help_text='Comma-separated scopes: read, export (* for all)', max_length=255)),
+                ('rate', models.CharField(blank=True, help_text='Rate limit for this key, e.g. 5000/hour (blank for the default)', max_length=20)),
+                ('is_active', models.BooleanField(default=True)),
+                ('request_count', models.PositiveBigIntegerField(default=0, editable=False)),
+                ('last_used_at', models.DateTimeField(blank=True, editable=False, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'API Key',
+                'verbose_name_plural': 'API Keys',
+                'ordering': ['name'],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0018_api_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RankedList',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('object_ids', models.JSONField(default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Ranked List',
+                'verbose_name_plural': 'Ranked Lists',
+                'ordering': ['name'],
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0019_ranked_list'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='achievement',
+            name='icon_image_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Resized copies of icon_image'),
+        ),
+        migrations.AddField(
+            model_name='experienceimage',
+            name='image_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Resized copies of image'),
+        ),
+        migrations.AddField(
+            model_name='projectscreenshot',
+            name='image_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Resized copies of image'),
+        ),
+        migrations.AddField(
+            model_name='skill',
+            name='icon_image_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Resized copies of icon_image'),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='profile_image_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Resized copies of profile_image'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+# collection -> number folded into the rowid (api_search.SEARCH_COLLECTION_KEYS)
+COLLECTION_KEYS = {'projects': 1, 'skills': 2, 'experience': 3, 'achievements': 4}
+ROWID_SLOTS = 8
+
+
+def key_search_rowids(apps, schema_editor):
+    """Renumber existing search rows so each rowid is derived from its object"""
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+
+    collection_key = ' '.join(
+        f"WHEN '{collection}' THEN {key}" for collection, key in COLLECTION_KEYS.items()
+    )
+    schema_editor.execute(
+        'CREATE TEMP TABLE portfolio_search_rows AS '
+        'SELECT collection, object_id, slug, title, body FROM portfolio_search'
+    )
+    schema_editor.execute('DELETE FROM portfolio_search')
+    schema_editor.execute(
+        'INSERT INTO portfolio_search (rowid, collection, object_id, slug, title, body) '
+        f'SELECT object_id * {ROWID_SLOTS} + CASE collection {collection_key} END, '
+        'collection, object_id, slug, title, body FROM portfolio_search_rows '
+        f'WHERE collection IN ({", ".join(repr(name) for name in COLLECTION_KEYS)}) '
+        'GROUP BY collection, object_id'
+    )
+    schema_editor.execute('DROP TABLE portfolio_search_rows')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0020_image_renditions'),
+    ]
+
+    operations = [
+        migrations.RunPython(key_search_rowids, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,29 @@
+import hashlib
+import secrets
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import models
 from django.utils import timezone
+from django.utils.text import slugify
+
+
+class CategoryQuerySet(models.QuerySet):
+    def with_item_counts(self):
+        """
+        Annotate `annotated_item_count` for every category in one query.
+
+        Each category counts the items of its own type, so listing N
+        categories no longer costs N extra COUNT queries.
+        """
+        counts = [
+            models.When(category_type=category_type, then=models.Count(relation, distinct=True))
+            for category_type, relation in Category.item_relations().items()
+        ]
+        return self.annotate(
+            annotated_item_count=models.Case(
+                *counts, default=models.Value(0), output_field=models.IntegerField()
+            )
+        )
 
 
 class Category(models.Model):
@@ -37,21 +61,80 @@ class Category(models.Model):
     class Meta:
         verbose_name_plural = "Categories"
         ordering = ["category_type", "name"]
+        indexes = [
+            models.Index(fields=["category_type", "name", "id"], name="category_keyset_idx"),
+        ]
+
+    # category_type -> reverse relation holding that type's items
+    ITEM_RELATIONS = {
+        "project": "projects",
+        "skill": "skills",
+        "achievement": "achievements",
+        "experience": "experiences",
+    }
+
+    objects = CategoryQuerySet.as_manager()
 
     def __str__(self):
         return f"{self.name} ({self.get_category_type_display()})"
 
+    @classmethod
+    def item_relations(cls):
+        """Return ITEM_RELATIONS limited to relations that exist on the model"""
+        relations = {}
+        for category_type, relation in cls.ITEM_RELATIONS.items():
+            try:
+                cls._meta.get_field(relation)
+            except FieldDoesNotExist:
+                continue
+            relations[category_type] = relation
+        return relations
+
     def item_count(self):
         """Return the number of items in this category based on type"""
-        if self.category_type == "project":
-            return self.projects.count()
-        elif self.category_type == "skill":
-            return self.skills.count() if hasattr(self, "skills") else 0
-        elif self.category_type == "achievement":
-            return self.achievements.count() if hasattr(self, "achievements") else 0
-        elif self.category_type == "experience":
-            return self.experiences.count() if hasattr(self, "experiences") else 0
-        return 0
+        if hasattr(self, "annotated_item_count"):
+            return self.annotated_item_count
+        relation = self.item_relations().get(self.category_type)
+        return getattr(self, relation).count() if relation else 0
+
+
+def split_technologies(value):
+    """Split a comma-separated technologies string into a list"""
+    return [tech.strip() for tech in value.split(",") if tech.strip()]
+
+
+def technology_slug(name):
+    """Slug for a technology name, keeping C, C++ and C# apart"""
+    return slugify(name.replace("+", " plus ").replace("#", " sharp "), allow_unicode=True)
+
+
+def parse_technologies(value):
+    """Return {slug: name} for a comma-separated technologies string"""
+    names = {}
+    for name in (value or "").split(","):
+        slug = technology_slug(name)
+        if slug:
+            names.setdefault(slug, name.strip())
+    return names
+
+
+class Technology(models.Model):
+    """Technology tag shared by projects (normalized from Project.technologies)"""
+
+    name = models.CharField(max_length=100)
+    slug = models.SlugField(max_length=120, unique=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "Technologies"
+        ordering = ["name"]
+        indexes = [
+            models.Index(fields=["name", "id"], name="technology_keyset_idx"),
+        ]
+
+    def __str__(self):
+        return self.name
 
 
 class Project(models.Model):
@@ -81,6 +164,12 @@ class Project(models.Model):
     technologies = models.CharField(
         max_length=500, help_text="Comma-separated list of technologies"
     )
+    technology_tags = models.ManyToManyField(
+        Technology,
+        blank=True,
+        related_name="projects",
+        help_text="Kept in sync with the technologies field on save",
+    )
     github_url = models.URLField(blank=True, null=True)
     live_url = models.URLField(blank=True, null=True)
     demo_url = models.URLField(blank=True, null=True)
@@ -113,6 +202,9 @@ class Project(models.Model):
 
     class Meta:
         ordering = ["-order", "-created_at"]
+        indexes = [
+            models.Index(fields=["-order", "-created_at", "-id"], name="project_keyset_idx"),
+        ]
 
     def __str__(self):
         return self.title
@@ -120,7 +212,22 @@ class Project(models.Model):
     @property
     def tech_list(self):
         """Return technologies as a list"""
-        return [tech.strip() for tech in self.technologies.split(",") if tech.strip()]
+        return split_technologies(self.technologies)
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.sync_technology_tags()
+
+    def sync_technology_tags(self):
+        """Point technology_tags at the names in the technologies field"""
+        names = parse_technologies(self.technologies)
+        existing = {tech.slug: tech for tech in Technology.objects.filter(slug__in=names)}
+        for slug, name in names.items():
+            if slug not in existing:
+                existing[slug], _created = Technology.objects.get_or_create(
+                    slug=slug, defaults={"name": name}
+                )
+        self.technology_tags.set(existing.values())
 
 
 class ProjectScreenshot(models.Model):
@@ -130,6 +237,9 @@ class ProjectScreenshot(models.Model):
         Project, on_delete=models.CASCADE, related_name="screenshots"
     )
     image = models.ImageField(upload_to="projects/screenshots/")
+    image_renditions = models.JSONField(
+        default=dict, blank=True, editable=False, help_text="Resized copies of image"
+    )
     caption = models.CharField(max_length=200, blank=True)
     order = models.IntegerField(default=0)
     uploaded_at = models.DateTimeField(auto_now_add=True)
@@ -167,6 +277,9 @@ class UserProfile(models.Model):
 
     # Profile Image
     profile_image = models.ImageField(upload_to="profile/", blank=True, null=True)
+    profile_image_renditions = models.JSONField(
+        default=dict, blank=True, editable=False, help_text="Resized copies of profile_image"
+    )
 
     # Social Links
     github = models.URLField(blank=True)
@@ -212,6 +325,17 @@ class UserProfile(models.Model):
         return self.full_name
 
 
+def format_duration(start_date, end_date, currently_working):
+    """Format an experience's dates, e.g. Jan 2020 - Present"""
+    start = start_date.strftime("%b %Y")
+    if currently_working:
+        return f"{start} - Present"
+    elif end_date:
+        end = end_date.strftime("%b %Y")
+        return f"{start} - {end}"
+    return start
+
+
 class Experience(models.Model):
     """Experience model for work experience"""
 
@@ -289,6 +413,9 @@ class Experience(models.Model):
 
     class Meta:
         ordering = ["-order", "-start_date"]
+        indexes = [
+            models.Index(fields=["-start_date", "-id"], name="experience_keyset_idx"),
+        ]
         verbose_name = "Experience"
         verbose_name_plural = "Experiences"
 
@@ -298,13 +425,7 @@ class Experience(models.Model):
     @property
     def duration(self):
         """Return formatted duration string"""
-        start = self.start_date.strftime("%b %Y")
-        if self.currently_working:
-            return f"{start} - Present"
-        elif self.end_date:
-            end = self.end_date.strftime("%b %Y")
-            return f"{start} - {end}"
-        return start
+        return format_duration(self.start_date, self.end_date, self.currently_working)
 
 
 class ExperienceImage(models.Model):
@@ -314,6 +435,9 @@ class ExperienceImage(models.Model):
         Experience, on_delete=models.CASCADE, related_name="images"
     )
     image = models.ImageField(upload_to="experience/images/")
+    image_renditions = models.JSONField(
+        default=dict, blank=True, editable=False, help_text="Resized copies of image"
+    )
     caption = models.CharField(max_length=200, blank=True)
     order = models.IntegerField(default=0)
 
@@ -364,6 +488,9 @@ class Skill(models.Model):
         null=True,
         help_text="Uploaded skill icon",
     )
+    icon_image_renditions = models.JSONField(
+        default=dict, blank=True, editable=False, help_text="Resized copies of icon_image"
+    )
     icon_class = models.CharField(
         max_length=100,
         blank=True,
@@ -401,6 +528,9 @@ class Skill(models.Model):
 
     class Meta:
         ordering = ["-proficiency", "name"]
+        indexes = [
+            models.Index(fields=["-proficiency", "name", "id"], name="skill_keyset_idx"),
+        ]
         verbose_name = "Skill"
         verbose_name_plural = "Skills"
 
@@ -466,6 +596,9 @@ class Achievement(models.Model):
         blank=True,
         help_text="Upload icon/badge image",
     )
+    icon_image_renditions = models.JSONField(
+        default=dict, blank=True, editable=False, help_text="Resized copies of icon_image"
+    )
     icon_class = models.CharField(
         max_length=100,
         blank=True,
@@ -511,6 +644,12 @@ class Achievement(models.Model):
 
     class Meta:
         ordering = ["-achievement_date", "title"]
+        indexes = [
+            models.Index(
+                fields=["-achievement_date", "-created_at", "-id"],
+                name="achievement_keyset_idx",
+            ),
+        ]
         verbose_name = "Achievement"
         verbose_name_plural = "Achievements"
 
@@ -562,3 +701,110 @@ class Notification(models.Model):
 
     def __str__(self):
         return f"{self.title} ({self.get_notification_type_display()})"
+
+
+class Tombstone(models.Model):
+    """Record of a deleted API object, served by the delta-sync feed"""
+
+    collection = models.CharField(max_length=50, help_text="API collection name")
+    object_id = models.BigIntegerField()
+    slug = models.CharField(max_length=255, blank=True)
+    deleted_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        ordering = ["deleted_at"]
+        verbose_name = "Tombstone"
+        verbose_name_plural = "Tombstones"
+
+    def __str__(self):
+        return f"{self.collection}:{self.object_id}"
+
+
+class RankedList(models.Model):
+    """Precomputed ids of a ranked list (featured projects, top skills), best first"""
+
+    name = models.CharField(max_length=50, unique=True)
+    object_ids = models.JSONField(default=list)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["name"]
+        verbose_name = "Ranked List"
+        verbose_name_plural = "Ranked Lists"
+
+    def __str__(self):
+        return self.name
+
+
+class RevokedToken(models.Model):
+    """JWT id (jti) rejected by stateless authentication until the token expires"""
+
+    jti = models.CharField(max_length=255, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+    revoked_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-revoked_at"]
+        verbose_name = "Revoked Token"
+        verbose_name_plural = "Revoked Tokens"
+
+    def __str__(self):
+        return self.jti
+
+
+class APIKey(models.Model):
+    """Key issued to one API consumer; only a SHA-256 hash of it is stored"""
+
+    RATE_PERIODS = ("s", "m", "h", "d")
+
+    name = models.CharField(max_length=100, help_text="Who the key was issued to")
+    prefix = models.CharField(max_length=8, editable=False, help_text="First characters of the key")
+    key_hash = models.CharField(max_length=64, unique=True, editable=False)
+    scopes = models.CharField(
+        max_length=255,
+        default="read",
+        help_text="Comma-separated scopes: read, export (* for all)",
+    )
+    rate = models.CharField(
+        max_length=20,
+        blank=True,
+        help_text="Rate limit for this key, e.g. 5000/hour (blank for the default)",
+    )
+    is_active = models.BooleanField(default=True)
+
+    # Usage, flushed in batches by the API
+    request_count = models.PositiveBigIntegerField(default=0, editable=False)
+    last_used_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    # Timestamps
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["name"]
+        verbose_name = "API Key"
+        verbose_name_plural = "API Keys"
+
+    def __str__(self):
+        return f"{self.name} ({self.prefix}…)"
+
+    @staticmethod
+    def hash_key(raw_key):
+        """Return the stored hash of a raw key"""
+        return hashlib.sha256(raw_key.encode("utf-8")).hexdigest()
+
+    def set_key(self):
+        """Generate a new key for this row and return it (it is not stored)"""
+        raw_key = secrets.token_urlsafe(32)
+        self.prefix = raw_key[:8]
+        self.key_hash = self.hash_key(raw_key)
+        return raw_key
+
+    def scope_list(self):
+        return [scope.strip() for scope in self.scopes.split(",") if scope.strip()]
+
+    def clean(self):
+        if self.rate:
+            num, _, period = self.rate.partition("/")
+            if not num.isdigit() or int(num) < 1 or period[:1] not in self.RATE_PERIODS:
+                raise ValidationError({"rate": "Use <requests>/<second|minute|hour|day>, e.g. 5000/hour"})
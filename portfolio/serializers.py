@@ -1,5 +1,9 @@
 from rest_framework import serializers
+from .api_fieldsets import SparseFieldsetSerializerMixin
+from .api_images import ImageRenditionsField
 from .models import (
+    format_duration,
+    split_technologies,
     Project,
     ProjectScreenshot,
     Experience,
@@ -8,18 +12,20 @@ from .models import (
     Achievement,
     Category,
     UserProfile,
+    Technology,
 )
 
 
 class ProjectScreenshotSerializer(serializers.ModelSerializer):
     """Serializer for project screenshots"""
+    image_renditions = ImageRenditionsField()
     
     class Meta:
         model = ProjectScreenshot
-        fields = ['id', 'image', 'caption', 'order', 'uploaded_at']
+        fields = ['id', 'image', 'image_renditions', 'caption', 'order', 'uploaded_at']
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """Serializer for categories"""
     item_count = serializers.IntegerField(read_only=True)
     category_type_display = serializers.CharField(source='get_category_type_display', read_only=True)
@@ -30,13 +36,30 @@ class CategorySerializer(serializers.ModelSerializer):
             'id', 'name', 'slug', 'category_type', 'category_type_display',
             'description', 'icon', 'color', 'item_count', 'created_at', 'updated_at'
         ]
+        source_columns = {'item_count': ['category_type']}
+        fast_fields = {
+            'item_count': (['annotated_item_count'], lambda row: row['annotated_item_count']),
+        }
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class TechnologySerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
+    """Serializer for technologies with their published project count"""
+    project_count = serializers.IntegerField(read_only=True)
+    
+    class Meta:
+        model = Technology
+        fields = ['id', 'name', 'slug', 'project_count']
+        source_columns = {'project_count': []}
+        fast_fields = {'project_count': (['project_count'], lambda row: row['project_count'])}
+
+
+class ProjectSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """Serializer for projects"""
     category = CategorySerializer(read_only=True)
     screenshots = ProjectScreenshotSerializer(many=True, read_only=True)
-    technologies_list = serializers.ListField(source='get_technologies_list', read_only=True)
+    technologies_list = serializers.ListField(source='tech_list', read_only=True)
+    featured_image = serializers.ImageField(source='thumbnail', read_only=True)
+    is_draft = serializers.SerializerMethodField()
     
     class Meta:
         model = Project
@@ -47,70 +70,99 @@ class ProjectSerializer(serializers.ModelSerializer):
             'status', 'order', 'screenshots',
             'is_active', 'is_draft', 'created_at', 'updated_at'
         ]
+        expandable_fields = {'category': False, 'screenshots': True}
+        source_columns = {
+            'technologies_list': ['technologies'],
+            'is_draft': ['status'],
+        }
+        fast_fields = {
+            'technologies_list': (['technologies'], lambda row: split_technologies(row['technologies'])),
+            'is_draft': (['status'], lambda row: row['status'] == 'draft'),
+        }
+    
+    def get_is_draft(self, obj):
+        return obj.status == 'draft'
 
 
 class ExperienceImageSerializer(serializers.ModelSerializer):
     """Serializer for experience images"""
+    image_renditions = ImageRenditionsField()
     
     class Meta:
         model = ExperienceImage
-        fields = ['id', 'image', 'caption', 'order', 'uploaded_at']
+        fields = ['id', 'image', 'image_renditions', 'caption', 'order']
 
 
-class ExperienceSerializer(serializers.ModelSerializer):
+class ExperienceSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """Serializer for experience"""
     images = ExperienceImageSerializer(many=True, read_only=True)
-    duration = serializers.CharField(source='get_duration', read_only=True)
+    duration = serializers.CharField(read_only=True)
     
     class Meta:
         model = Experience
         fields = [
-            'id', 'position', 'company_name', 'company_logo',
-            'location', 'employment_type', 'start_date', 'end_date',
-            'currently_working', 'duration', 'description',
-            'responsibilities', 'achievements_text', 'technologies',
-            'images', 'order', 'is_active', 'is_draft',
+            'id', 'position', 'slug', 'company_name', 'company_about',
+            'company_website', 'company_logo', 'location', 'employment_type',
+            'employment_status', 'start_date', 'end_date',
+            'currently_working', 'duration', 'short_description',
+            'detailed_description', 'images', 'order', 'is_active', 'is_draft',
             'created_at', 'updated_at'
         ]
+        expandable_fields = {'images': True}
+        source_columns = {'duration': ['start_date', 'end_date', 'currently_working']}
+        fast_fields = {
+            'duration': (
+                ['start_date', 'end_date', 'currently_working'],
+                lambda row: format_duration(row['start_date'], row['end_date'], row['currently_working']),
+            ),
+        }
 
 
-class SkillSerializer(serializers.ModelSerializer):
+class SkillSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """Serializer for skills"""
-    category = CategorySerializer(read_only=True)
     skill_level_display = serializers.CharField(source='get_skill_level_display', read_only=True)
+    icon_image_renditions = ImageRenditionsField()
     
     class Meta:
         model = Skill
         fields = [
-            'id', 'name', 'category', 'proficiency', 'skill_level',
-            'skill_level_display', 'icon', 'description', 'years_of_experience',
+            'id', 'name', 'slug', 'proficiency', 'skill_level',
+            'skill_level_display', 'icon_type', 'icon_image', 'icon_image_renditions', 'icon_class',
+            'description', 'certificate_type', 'certificate_url',
             'order', 'is_active', 'is_draft', 'created_at', 'updated_at'
         ]
 
 
-class AchievementSerializer(serializers.ModelSerializer):
+class AchievementSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """Serializer for achievements"""
-    category = CategorySerializer(read_only=True)
+    category_display = serializers.CharField(source='get_category_display', read_only=True)
+    icon_image_renditions = ImageRenditionsField()
     
     class Meta:
         model = Achievement
         fields = [
-            'id', 'title', 'description', 'category', 'icon',
-            'achievement_date', 'issuer', 'certificate_url',
+            'id', 'title', 'slug', 'short_description', 'full_description',
+            'category', 'category_display', 'icon_type', 'icon_image', 'icon_image_renditions',
+            'icon_class',
+            'achievement_date', 'expiration_date', 'no_expiration',
+            'issuing_organization', 'credential_type', 'credential_url',
+            'credential_id', 'related_link',
             'order', 'is_active', 'is_draft', 'created_at', 'updated_at'
         ]
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """Serializer for user profile"""
+    profile_image_renditions = ImageRenditionsField()
     
     class Meta:
         model = UserProfile
         fields = [
             'id', 'full_name', 'email', 'phone', 'location',
-            'title', 'bio', 'profile_image', 'resume', 'cover_letter',
-            'video_resume', 'github_url', 'linkedin_url', 'twitter_url',
-            'portfolio_url', 'other_url', 'hourly_rate', 'experience_years',
+            'title', 'bio', 'profile_image', 'profile_image_renditions',
+            'resume', 'cover_letter',
+            'video_resume', 'github', 'linkedin', 'twitter',
+            'instagram', 'youtube', 'website', 'hourly_rate', 'experience_years',
             'open_to_opportunities', 'available_for_freelance',
             'created_at', 'updated_at'
         ]
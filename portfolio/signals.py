@@ -0,0 +1,149 @@
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_delete, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .api_cache import bump_content_version
+from .api_cdn import get_collection_keys, get_instance_keys, schedule_purge, surrogate_key
+from .api_documents import schedule_portfolio_warm
+from .api_images import RENDITION_FIELDS, update_renditions
+from .api_keys import clear_api_key_cache
+from .api_rankings import RANKED_LIST_NAMES, rebuild_ranked_lists
+from .api_search import SEARCH_COLLECTION_NAMES, index_instance, remove_instance
+from .api_sync import record_tombstone
+from .models import (
+    APIKey,
+    Project,
+    ProjectScreenshot,
+    Experience,
+    ExperienceImage,
+    Skill,
+    Achievement,
+    Category,
+    UserProfile,
+    Technology,
+)
+
+
+# Models whose rows are served by the read-only API
+API_CONTENT_MODELS = [
+    Project,
+    ProjectScreenshot,
+    Experience,
+    ExperienceImage,
+    Skill,
+    Achievement,
+    Category,
+    UserProfile,
+    Technology,
+]
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_api_cache(sender, **kwargs):
+    """Bump the content version so cached API responses are never stale"""
+    if sender in API_CONTENT_MODELS:
+        bump_content_version(sender)
+        schedule_portfolio_warm()
+
+
+@receiver(m2m_changed, sender=Project.technology_tags.through)
+def invalidate_project_technologies(sender, action, **kwargs):
+    """Re-tagging a project changes both projects and technology counts"""
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_content_version(Project)
+        bump_content_version(Technology)
+
+
+@receiver(post_delete)
+def record_api_tombstone(sender, instance, **kwargs):
+    """Keep a tombstone so delta-sync clients learn about the delete"""
+    if sender in API_CONTENT_MODELS:
+        record_tombstone(instance)
+
+
+@receiver(post_save)
+def update_search_index(sender, instance, **kwargs):
+    """Re-index a searchable object (or drop it once unpublished)"""
+    if sender in SEARCH_COLLECTION_NAMES:
+        index_instance(instance)
+
+
+@receiver(post_delete)
+def remove_search_index(sender, instance, **kwargs):
+    """Drop a deleted object from the search index"""
+    if sender in SEARCH_COLLECTION_NAMES:
+        remove_instance(instance)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def update_ranked_lists(sender, **kwargs):
+    """Rebuild the featured/top lists ranked from the changed model"""
+    if sender in RANKED_LIST_NAMES:
+        rebuild_ranked_lists(sender)
+
+
+@receiver(pre_save)
+def generate_image_renditions(sender, instance, **kwargs):
+    """Resize new or replaced images once, stored with the object"""
+    if sender in RENDITION_FIELDS:
+        update_renditions(instance)
+
+
+@receiver(post_save, sender=ProjectScreenshot)
+@receiver(post_delete, sender=ProjectScreenshot)
+def touch_screenshot_project(sender, instance, **kwargs):
+    """A screenshot change is a change to its project"""
+    Project.objects.filter(pk=instance.project_id).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=ExperienceImage)
+@receiver(post_delete, sender=ExperienceImage)
+def touch_image_experience(sender, instance, **kwargs):
+    """A workplace image change is a change to its experience"""
+    Experience.objects.filter(pk=instance.experience_id).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=APIKey)
+@receiver(post_delete, sender=APIKey)
+def forget_api_key(sender, **kwargs):
+    """Drop this process's cached key lookups (others expire after API_KEY_CACHE_TTL)"""
+    clear_api_key_cache()
+
+
+@receiver(pre_save)
+@receiver(pre_delete)
+def remember_surrogate_keys(sender, instance, **kwargs):
+    """Note the keys an object had before the change (old slug, old category)"""
+    if sender in API_CONTENT_MODELS and instance.pk is not None:
+        previous = sender._default_manager.filter(pk=instance.pk).first()
+        instance._previous_surrogate_keys = get_instance_keys(previous) if previous else set()
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def purge_changed_surrogate_keys(sender, instance, **kwargs):
+    """Purge CDN responses containing the object, before and after the change"""
+    if sender in API_CONTENT_MODELS:
+        keys = get_instance_keys(instance) if kwargs.get('signal') is post_save else set()
+        keys |= getattr(instance, '_previous_surrogate_keys', set())
+        schedule_purge(keys | get_collection_keys(sender))
+
+
+@receiver(m2m_changed, sender=Project.technology_tags.through)
+def purge_project_technologies(sender, instance, action, pk_set, **kwargs):
+    """Re-tagging a project changes the tags' project counts"""
+    if action == 'pre_clear':
+        instance._cleared_technology_keys = {
+            surrogate_key(Technology, slug)
+            for slug in instance.technology_tags.values_list('slug', flat=True)
+        }
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        keys = getattr(instance, '_cleared_technology_keys', set())
+        if pk_set:
+            keys |= {
+                surrogate_key(Technology, slug)
+                for slug in Technology.objects.filter(pk__in=pk_set).values_list('slug', flat=True)
+            }
+        schedule_purge(keys | {surrogate_key(Project, instance.pk)} | get_collection_keys(Technology))
@@ -1,3 +1,289 @@
-from django.test import TestCase
+import datetime
+import io
+import shutil
+import tempfile
+import time
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .api_auth import (
+    RevocationSet,
+    StatelessJWTAuthentication,
+    revoke_token,
+    revoked_tokens,
+    verified_tokens,
+)
+from .api_keys import APIKeyInfo
+from .api_renderers import dumps_json
+from .api_urls import router
+from .api_views import ExportAPIKeyPermission
+from .models import (
+    Project,
+    ProjectScreenshot,
+    Experience,
+    ExperienceImage,
+    Skill,
+    Achievement,
+    Category,
+    RevokedToken,
+)
+
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+# prefix -> ViewSet, for the ViewSets with a values() list path
+FAST_LIST_VIEWSETS = {
+    prefix: viewset
+    for prefix, viewset, _basename in router.registry
+    if getattr(viewset, 'fast_list', False)
+}
+
+
+def make_image(name, width, height):
+    output = io.BytesIO()
+    Image.new('RGB', (width, height), (40, 90, 160)).save(output, 'PNG')
+    return SimpleUploadedFile(name, output.getvalue(), content_type='image/png')
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class FastSerializerEquivalenceTests(TestCase):
+    """The values() list path must render exactly what the serializers do"""
+
+    @classmethod
+    def setUpTestData(cls):
+        web = Category.objects.create(name='Web', slug='web', category_type='project')
+        Category.objects.create(name='Empty', slug='empty', category_type='project')
+        Category.objects.create(name='Backend', slug='backend', category_type='skill')
+
+        shown = Project.objects.create(
+            title='Shop', slug='shop', description='Online shop', category=web,
+            technologies='Django, Redis', status='completed', order=2,
+        )
+        ProjectScreenshot.objects.create(project=shown, image=make_image('home.png', 1600, 900), order=1)
+        ProjectScreenshot.objects.create(project=shown, image=make_image('tiny.png', 200, 100), order=2)
+        # No category and no screenshots
+        Project.objects.create(
+            title='Blog', slug='blog', description='A blog', technologies='Django', status='active',
+        )
+        Project.objects.create(
+            title='Draft', slug='draft', description='Hidden', category=web,
+            technologies='Vue', status='draft',
+        )
+
+        job = Experience.objects.create(
+            position='Developer', slug='developer', company_name='Acme',
+            start_date=datetime.date(2021, 3, 1), end_date=datetime.date(2023, 6, 1),
+            short_description='Built things',
+        )
+        ExperienceImage.objects.create(experience=job, image=make_image('office.png', 700, 400))
+        Experience.objects.create(
+            position='Lead', slug='lead', company_name='Initech',
+            start_date=datetime.date(2023, 7, 1), currently_working=True,
+            short_description='Leads things',
+        )
+
+        Skill.objects.create(
+            name='Python', slug='python', proficiency=90, skill_level='expert',
+            icon_image=make_image('python.png', 800, 800),
+        )
+        Skill.objects.create(name='CSS', slug='css', proficiency=60, skill_level='intermediate')
+
+        Achievement.objects.create(
+            title='AWS Certified', slug='aws-certified', category='certification',
+            issuing_organization='AWS', achievement_date=datetime.date(2022, 5, 1),
+            short_description='Cloud', icon_image=make_image('aws.png', 400, 400),
+        )
+        Achievement.objects.create(
+            title='Hackathon', slug='hackathon', category='competition',
+            issuing_organization='City', achievement_date=datetime.date(2020, 1, 1),
+            short_description='First place',
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def get_view(self, prefix, query=''):
+        view = FAST_LIST_VIEWSETS[prefix]()
+        view.action_map = {'get': 'list'}
+        view.action = 'list'
+        view.format_kwarg = None
+        view.args, view.kwargs = (), {}
+        request = APIRequestFactory().get(f'/api/{prefix}/{query}')
+        view.request = view.initialize_request(request)
+        return view
+
+    def assertFastPathMatches(self, prefix, query=''):
+        view = self.get_view(prefix, query)
+        queryset = view.filter_queryset(view.get_queryset())
+        fast = view.get_fast_serializer(queryset)
+        self.assertIsNotNone(fast, f'{prefix} has no fast path')
+
+        expected = view.get_serializer(queryset, many=True).data
+        actual = fast.serialize(view.get_fast_rows(fast, queryset))
+        self.assertEqual(dumps_json(actual), dumps_json(expected))
+        return actual
+
+    def test_every_fast_list_viewset(self):
+        for prefix in FAST_LIST_VIEWSETS:
+            with self.subTest(prefix):
+                self.assertTrue(self.assertFastPathMatches(prefix))
+
+    def test_filtered_lists(self):
+        self.assertFastPathMatches('projects', '?category=web')
+        self.assertFastPathMatches('categories', '?type=project')
+
+    def test_nested_category_item_count(self):
+        projects = self.assertFastPathMatches('projects')
+        shop = next(row for row in projects if row['slug'] == 'shop')
+        # The draft project counts towards its category, as in the serializer
+        self.assertEqual(shop['category']['item_count'], 2)
+
+    def test_empty_relations(self):
+        projects = self.assertFastPathMatches('projects')
+        blog = next(row for row in projects if row['slug'] == 'blog')
+        self.assertIsNone(blog['category'])
+        self.assertEqual(blog['screenshots'], [])
+
+        experience = self.assertFastPathMatches('experience')
+        lead = next(row for row in experience if row['slug'] == 'lead')
+        self.assertEqual(lead['images'], [])
+
+    def test_renditions(self):
+        projects = self.assertFastPathMatches('projects')
+        shop = next(row for row in projects if row['slug'] == 'shop')
+        home, tiny = shop['screenshots']
+        self.assertEqual(
+            [(rendition['width'], rendition['height']) for rendition in home['image_renditions']['renditions']],
+            [(320, 180), (640, 360), (1280, 720)],
+        )
+        self.assertTrue(home['image_renditions']['srcset'].endswith(' 1600w'))
+        # Narrower than every rendition width: only the original
+        self.assertEqual(tiny['image_renditions']['renditions'], [])
+
+        skills = self.assertFastPathMatches('skills')
+        css = next(row for row in skills if row['slug'] == 'css')
+        self.assertIsNone(css['icon_image_renditions'])
+
+    def test_choice_displays(self):
+        skills = self.assertFastPathMatches('skills')
+        self.assertEqual(
+            {row['slug']: row['skill_level_display'] for row in skills},
+            {'python': 'Expert', 'css': 'Intermediate'},
+        )
+        achievements = self.assertFastPathMatches('achievements')
+        self.assertEqual(
+            {row['slug']: row['category_display'] for row in achievements},
+            {'aws-certified': 'Certification', 'hackathon': 'Competition'},
+        )
+        categories = self.assertFastPathMatches('categories')
+        self.assertEqual(
+            {row['slug']: row['category_type_display'] for row in categories},
+            {'web': 'Project', 'empty': 'Project', 'backend': 'Skill'},
+        )
+
+
+@override_settings(API_JWT_REVOCATION_REFRESH=0)
+class TokenRevocationTests(TestCase):
+    """Revoked JWTs stay rejected, in every process, until they expire"""
+
+    def setUp(self):
+        self.token = AccessToken.for_user(User.objects.create(username='bot'))
+        self.raw_token = str(self.token).encode()
+        verified_tokens.clear()
+        revoked_tokens.loaded_at = None
+
+    def authenticate(self):
+        return StatelessJWTAuthentication().get_validated_token(self.raw_token)
+
+    def test_revoked_token_is_rejected(self):
+        self.assertEqual(self.authenticate()['jti'], self.token['jti'])
+        revoke_token(self.token)
+        with self.assertRaises(InvalidToken):
+            self.authenticate()
+
+    def test_revocation_reaches_other_processes(self):
+        other = RevocationSet()
+        self.assertNotIn(self.token['jti'], other)
+        revoke_token(self.token)
+        self.assertIn(self.token['jti'], other)
+
+    def test_revocation_survives_cache_eviction(self):
+        revoke_token(self.token)
+        cache.clear()
+        self.assertIn(self.token['jti'], RevocationSet())
+        with self.assertRaises(InvalidToken):
+            self.authenticate()
+
+    def test_concurrent_revocations_are_kept(self):
+        first, second = RevocationSet(), RevocationSet()
+        first.revoke('first-jti', time.time() + 60)
+        second.revoke('second-jti', time.time() + 60)
+        reader = RevocationSet()
+        self.assertIn('first-jti', reader)
+        self.assertIn('second-jti', reader)
+
+    def test_expired_revocations_are_dropped(self):
+        revocations = RevocationSet()
+        revocations.revoke('old-jti', time.time() - 1)
+        self.assertNotIn('old-jti', RevocationSet())
+        revocations.revoke('new-jti', time.time() + 60)
+        self.assertEqual(list(RevokedToken.objects.values_list('jti', flat=True)), ['new-jti'])
+
+
+class PortfolioWarmTests(TestCase):
+    """A transaction rebuilds the bundle document once, after it commits"""
+
+    def save_skills(self, count):
+        for index in range(count):
+            Skill.objects.create(name=f'Skill {index}', slug=f'skill-{index}', proficiency=50)
+
+    @mock.patch('portfolio.api_documents.warm_portfolio_document')
+    def test_one_warm_per_transaction(self, warm):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.save_skills(5)
+        warm.assert_called_once_with()
+
+    @mock.patch('portfolio.api_documents.warm_portfolio_document')
+    def test_warm_after_rollback(self, warm):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    self.save_skills(1)
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            # The rolled-back warm is gone, so this change registers its own
+            self.save_skills(1)
+        warm.assert_called_once_with()
+
+
+class APIKeyScopeTests(TestCase):
+    """A key never gets less access than sending no key at all"""
+
+    def has_permission(self, scopes=None):
+        request = mock.Mock(user=AnonymousUser())
+        request.auth = APIKeyInfo(1, 'bot', scopes, None) if scopes is not None else None
+        return ExportAPIKeyPermission().has_permission(request, None)
+
+    @override_settings(API_KEY_REQUIRED=False)
+    def test_scopes_ignored_when_keys_optional(self):
+        self.assertTrue(self.has_permission())
+        self.assertTrue(self.has_permission(['read']))
+
+    @override_settings(API_KEY_REQUIRED=True)
+    def test_scopes_enforced_when_keys_required(self):
+        self.assertFalse(self.has_permission())
+        self.assertFalse(self.has_permission(['read']))
+        self.assertTrue(self.has_permission(['read', 'export']))
+        self.assertTrue(self.has_permission(['*']))
@@ -12,6 +12,7 @@ from .models import (
     Achievement,
     Notification,
 )
+from .api_rankings import filter_ranked
 from .forms import ProjectForm, CategoryForm, UserProfileForm, ExperienceForm, SkillForm, AchievementForm
 from django.utils.text import slugify
 import json
@@ -34,7 +35,7 @@ def dashboard(request):
     recent_achievements = Achievement.objects.order_by('-achievement_date')[:3]
     
     # Get top 5 skills (by proficiency percentage)
-    top_skills = Skill.objects.filter(is_active=True).order_by('-proficiency')[:5]
+    top_skills = filter_ranked(Skill.objects.all(), 'top-skills')[:5]
     
     # Get category counts (top 5 only)
     category_counts = Project.objects.values('category__name', 'category__icon').annotate(count=Count('id')).order_by('-count')[:5]
@@ -790,7 +791,7 @@ def manage_categories(request):
                 )
 
     # GET request - display categories
-    categories = Category.objects.all()
+    categories = Category.objects.with_item_counts()
     form = CategoryForm()
     context = {"categories": categories, "form": form}
     return render(request, "manage_categories.html", context)